@@ -1,16 +1,399 @@
 #!/usr/bin/env python3
 
 import os
+import re
 import sys
 import json
+import argparse
+import mmap
+import time
+import errno
+import fcntl
+import select
 import shutil
+import signal
+import threading
 import zipfile
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 import configparser
 
+# Executables in these folders (or with these names) are never the game binary
+_EXE_SKIP_DIRS = frozenset({'engine', 'redist', 'directx', 'vcredist', '_commonredist', 'tools', 'crash'})
+_EXE_SKIP_NAMES = frozenset({'unins', 'setup', 'launcher', 'redist', 'vcredist', 'directx', 'crash'})
+_EXE_SKIP_DIR_RE = re.compile('|'.join(map(re.escape, sorted(_EXE_SKIP_DIRS))))
+_EXE_SKIP_NAME_RE = re.compile('|'.join(map(re.escape, sorted(_EXE_SKIP_NAMES))))
+# Folders that usually hold the main executable
+_EXE_COMMON_FOLDERS = ('bin/x64', 'retail', 'binaries/win64')
+
+# "LaunchOptions" key of a localconfig.vdf app section; group 1 is the escaped value
+_LAUNCH_OPTS_RE = re.compile(rb'"LaunchOptions"\s+"((?:[^"\\]|\\.)*)"')
+# VDF tokens: a quoted string (group 1, escapes kept) or a brace (group 2)
+_VDF_TOKEN_RE = re.compile(rb'"((?:[^"\\]|\\.)*)"|([{}])')
+
+# "path" entries of steamapps/libraryfolders.vdf
+_LIBRARY_PATH_RE = re.compile(r'"path"\s*"([^"]+)"')
+
+# Directory names that mark a loose amdxcffx64*.dll as an FSR4 build
+_FSR4_DIR_RE = re.compile(r'4\.0|FSR')
+
+# Latest find_available_fsr4_versions result, keyed by the search directories and their mtimes
+_fsr4_versions_cache: Dict[tuple, Dict[str, Path]] = {}
+
+# Launch option environment shared by the catalog's command variants
+_OPTISCALER_BASE_ENV = 'WINEDLLOVERRIDES="dxgi=n,b"'
+_BASIC_ENV = f'{_OPTISCALER_BASE_ENV} PROTON_FSR4_UPGRADE=1'
+_ADVANCED_ENV = (f'{_BASIC_ENV} DXVK_ASYNC=1 PROTON_ENABLE_NVAPI=1 PROTON_HIDE_NVIDIA_GPU=0'
+                 ' VKD3D_CONFIG=dxr11,dxr WINE_CPU_TOPOLOGY=4:2')
+_RDNA3_BASE_ENV = f'{_OPTISCALER_BASE_ENV} DXIL_SPIRV_CONFIG=wmma_rdna3_workaround'
+
+# Prefault mapped pages up front where the platform supports it (Linux)
+_MAP_FLAGS = mmap.MAP_SHARED | getattr(mmap, 'MAP_POPULATE', 0)
+
+# _newest_user_dir results, keyed by the userdata directory and its mtime
+_user_dir_cache: Dict[tuple, Tuple[Optional[str], int]] = {}
+
+# How long a cached GitHub release list is trusted before revalidating it
+_RELEASES_TTL = 6 * 60 * 60
+
+# ioctl(FICLONE) shares the source's extents with the destination (btrfs, XFS, bcachefs)
+_FICLONE = 0x40049409
+_CLONE_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY})
+
+# appid/name/installdir lines of an appmanifest_*.acf; the last occurrence of each key wins
+_MANIFEST_RE = re.compile(rb'^[ \t]*"(appid|name|installdir)"[ \t]+"([^"\n]*)"', re.MULTILINE)
+
+# OptiScaler.ini edits: the Fsr4Update line, and the [OptiScaler] header line (with its newline)
+_INI_FSR4_UPDATE_RE = re.compile(r'^[ \t]*Fsr4Update[ \t]*=.*$', re.MULTILINE)
+_INI_OPTISCALER_SECTION_RE = re.compile(r'^[ \t]*\[OptiScaler\][ \t]*(?:\r?\n|$)', re.MULTILINE)
+
+# Game files OptiScaler may replace; backed up before install
+_FILES_TO_BACKUP = frozenset({
+    "nvngx.dll", "libxess.dll", "amd_fidelityfx_fsr2.dll",
+    "amd_fidelityfx_fsr3.dll", "ffx_fsr2_api_x64.dll"
+})
+
+# Files and directories removed on uninstall, in removal order
+_OPTISCALER_FILES = (
+    "OptiScaler.dll", "OptiScaler.ini", "OptiScaler.log", "OptiScaler Setup.bat",
+    "setup_linux.sh", "setup_windows.bat", "remove_optiscaler.sh",
+    # Possible renamed OptiScaler DLL files
+    "dxgi.dll", "winmm.dll", "version.dll", "dbghelp.dll",
+    "d3d12.dll", "wininet.dll", "winhttp.dll", "OptiScaler.asi",
+    # Other DLSS/FSR files that might get installed
+    "nvngx.dll", "libxess.dll", "amd_fidelityfx_fsr2.dll",
+    "amd_fidelityfx_fsr3.dll", "ffx_fsr2_api_x64.dll"
+)
+_OPTISCALER_DIRS = ("D3D12_Optiscaler", "DlssOverrides", "Licenses")
+
+# Setup and removal scripts shipped with OptiScaler, in order of preference
+_SETUP_SCRIPT_NAMES = ("setup_linux.sh", "OptiScaler Setup.sh", "setup.sh")
+_REMOVAL_SCRIPT_NAMES = ("remove_optiscaler.sh", "uninstall_optiscaler.sh", "remove.sh", "uninstall.sh")
+
+# Directories never worth descending into when searching for DLLs or executables
+_WALK_SKIP_DIRS = frozenset({'node_modules', '.git', 'depotcache', 'shadercache', '__pycache__'})
+
+def _walk(root, max_depth: int = 4, skip_hidden: bool = True,
+          skip_dirs: frozenset = _WALK_SKIP_DIRS,
+          prune: Optional[Callable[[str], object]] = None) -> Iterator[os.DirEntry]:
+    """Yield every entry below root, descending at most max_depth levels.
+
+    Hidden directories, directories named in skip_dirs and directories whose
+    lowercased name satisfies prune are not descended into, and symlinked
+    directories are not followed. Unreadable directories are skipped.
+    """
+    stack = [(os.fspath(root), 0)]
+    while stack:
+        path, depth = stack.pop()
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if depth < max_depth and entry.is_dir(follow_symlinks=False):
+                        name_lower = entry.name.lower()
+                        if (not (skip_hidden and name_lower.startswith('.'))
+                                and name_lower not in skip_dirs
+                                and not (prune and prune(name_lower))):
+                            stack.append((entry.path, depth + 1))
+                    yield entry
+        except OSError:
+            continue
+
+def _spawn(cmd: List[str], quiet: bool = False) -> None:
+    """Start cmd in its own session without waiting for it.
+
+    With quiet, stdout and stderr go to /dev/null. The Popen object is dropped
+    on purpose: subprocess reaps finished children it no longer references
+    whenever it starts another process, so they do not pile up as zombies.
+    """
+    stream = subprocess.DEVNULL if quiet else None
+    subprocess.Popen(cmd, stdout=stream, stderr=stream, start_new_session=True)
+
+def _find_vdf_app_block(content, app_id: str) -> Tuple[bool, int, int]:
+    """Locate the "<app_id>" block under Steam's "apps" key in localconfig.vdf.
+
+    content is bytes or an mmap. Tokens are read in order, so braces inside
+    quoted names or values are never counted. Returns (apps_found, open, close)
+    with the offsets of the block's braces, or -1 for both if it is missing.
+    """
+    app_key = app_id.encode()
+    keys = []         # key of every open block, outermost first
+    pending = None    # string that may turn out to be a key
+    apps_found = False
+    app_depth = None
+    brace_start = -1
+    for token in _VDF_TOKEN_RE.finditer(content):
+        string, brace = token.group(1), token.group(2)
+        if string is not None:
+            # A second string completes a key/value pair
+            pending = string if pending is None else None
+        elif brace == b'{':
+            if (app_depth is None and pending == app_key and len(keys) >= 2
+                    and keys[-1].lower() == b'apps' and keys[-2].lower() == b'steam'):
+                app_depth = len(keys)
+                brace_start = token.start()
+            keys.append(pending or b'')
+            if pending and pending.lower() == b'apps':
+                apps_found = True
+            pending = None
+        else:
+            if keys:
+                keys.pop()
+            pending = None
+            if app_depth is not None and len(keys) == app_depth:
+                return True, brace_start, token.start()
+    return apps_found, -1, -1
+
+def _newest_user_dir(userdata_path) -> Tuple[Optional[str], int]:
+    """Return the most recently modified numeric Steam user dir and how many there are.
+
+    One scandir pass; is_dir() and stat() come from the cached DirEntry data.
+    The answer is reused until userdata_path itself changes, i.e. until a user
+    directory is added or removed.
+    """
+    userdata_path = os.fspath(userdata_path)
+    key = (userdata_path, os.stat(userdata_path).st_mtime_ns)
+    cached = _user_dir_cache.get(key)
+    if cached is not None:
+        return cached
+    best, best_mtime, count = None, -1.0, 0
+    with os.scandir(userdata_path) as it:
+        for entry in it:
+            if entry.name.isdigit() and entry.is_dir(follow_symlinks=False):
+                count += 1
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                if mtime > best_mtime:
+                    best_mtime, best = mtime, entry.path
+    _user_dir_cache.clear()
+    _user_dir_cache[key] = (best, count)
+    return best, count
+
+def _write_all(fd: int, data) -> None:
+    """os.write() all of data to fd, retrying short writes."""
+    with memoryview(data) as remaining:
+        while remaining:
+            remaining = remaining[os.write(fd, remaining):]
+
+def _copy_range(src_fd: int, dst_fd: int, offset: int, count: int, src_map=None) -> None:
+    """Append count bytes of src_fd starting at offset to dst_fd.
+
+    The copy happens in the kernel with copy_file_range; whatever it cannot
+    copy is written from src_map, a mapping of the same file, or read with pread.
+    """
+    end = offset + count
+    try:
+        while offset < end:
+            copied = os.copy_file_range(src_fd, dst_fd, end - offset, offset_src=offset)
+            if copied == 0:
+                break
+            offset += copied
+    except (AttributeError, OSError):
+        pass  # unsupported here, finish in userspace
+    if offset < end and src_map is not None:
+        _write_all(dst_fd, memoryview(src_map)[offset:end])
+        return
+    while offset < end:
+        chunk = os.pread(src_fd, min(end - offset, 1 << 20), offset)
+        if not chunk:
+            break
+        _write_all(dst_fd, chunk)
+        offset += len(chunk)
+
+def _fast_copy(src, dst) -> None:
+    """Copy src to dst like shutil.copy2, moving the data with os.sendfile.
+
+    The bytes go page cache to page cache without a userspace buffer; if
+    sendfile is refused, the rest is copied with copyfileobj in 1 MiB blocks.
+    """
+    try:
+        if os.path.samefile(src, dst):
+            raise shutil.SameFileError(f"{src!r} and {dst!r} are the same file")
+    except FileNotFoundError:
+        pass  # dst does not exist yet
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        size = os.fstat(fsrc.fileno()).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            pass  # not supported for these files, finish in userspace
+        if offset < size:
+            fsrc.seek(offset)
+            fdst.seek(offset)
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copystat(src, dst)
+
+def _backup_copy(src, dst) -> None:
+    """Copy src to dst like shutil.copy2, never exposing a partially written dst.
+
+    The data goes into an unnamed O_TMPFILE in dst's directory, reflinked where
+    the filesystem allows and otherwise copied with copy_file_range, and the
+    finished file is then linked in as dst. Falls back to shutil.copy2 where
+    O_TMPFILE is unsupported or the file cannot be linked in (no /proc, or
+    linkat refused by the filesystem or a sandbox).
+    """
+    dst_dir, dst_name = os.path.split(os.fspath(dst))
+    dir_fd = os.open(dst_dir or '.', os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        try:
+            tmp_fd = os.open('.', os.O_TMPFILE | os.O_WRONLY, 0o644, dir_fd=dir_fd)
+        except (AttributeError, OSError):
+            shutil.copy2(src, dst)
+            return
+        try:
+            with open(src, 'rb') as fsrc:
+                try:
+                    fcntl.ioctl(tmp_fd, _FICLONE, fsrc.fileno())
+                except OSError as e:
+                    if e.errno not in _CLONE_UNSUPPORTED:
+                        raise
+                    _copy_range(fsrc.fileno(), tmp_fd, 0, os.fstat(fsrc.fileno()).st_size)
+            try:
+                try:
+                    os.unlink(dst_name, dir_fd=dir_fd)
+                except FileNotFoundError:
+                    pass
+                # With a dir fd, os.link uses linkat(AT_SYMLINK_FOLLOW), which can link a /proc fd
+                os.link(f'/proc/self/fd/{tmp_fd}', dst_name, dst_dir_fd=dir_fd)
+                linked = True
+            except OSError:
+                linked = False  # copied the plain way below
+        finally:
+            os.close(tmp_fd)
+    finally:
+        os.close(dir_fd)
+    if linked:
+        shutil.copystat(src, dst)
+    else:
+        shutil.copy2(src, dst)
+
+def _replace_file(path, data: bytes) -> None:
+    """Write data to a temp file next to path and rename it over path."""
+    temp_path = f"{os.fspath(path)}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(data)
+    os.replace(temp_path, path)
+
+def _extract_zip(archive_path, target_dir) -> None:
+    """Extract a zip archive, inflating its members on several threads.
+
+    zlib releases the GIL while inflating, but a ZipFile handle cannot be
+    shared between threads, so each worker opens its own. Directories are
+    created up front so workers never race to create the same parent.
+    """
+    root = os.path.realpath(target_dir)
+    with zipfile.ZipFile(archive_path) as zf:
+        members = zf.infolist()
+    
+    for name in {os.path.dirname(member.filename) for member in members}:
+        path = os.path.normpath(os.path.join(root, name))
+        if name and path.startswith(root + os.sep):
+            os.makedirs(path, exist_ok=True)
+    
+    local = threading.local()
+    handles = []
+    
+    def extract(member):
+        zf = getattr(local, 'zf', None)
+        if zf is None:
+            zf = local.zf = zipfile.ZipFile(archive_path)
+            handles.append(zf)
+        zf.extract(member, root)
+    
+    try:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as pool:
+            list(pool.map(extract, [m for m in members if not m.is_dir()]))
+    finally:
+        for zf in handles:
+            zf.close()
+
+def _iter_steam_pids() -> Iterator[int]:
+    """Yield the pids of running Steam processes, matched on /proc/<pid>/comm.
+
+    Our own process is never reported. Raises OSError when /proc is unavailable.
+    """
+    own_pid = os.getpid()
+    for name in os.listdir('/proc'):
+        if not name.isdigit() or int(name) == own_pid:
+            continue
+        try:
+            with open(f'/proc/{name}/comm', 'rb') as f:
+                comm = f.read(16)
+        except OSError:
+            continue  # process exited while scanning
+        if comm.strip().lower().startswith(b'steam'):
+            yield int(name)
+
+def _find_steam_pids() -> List[int]:
+    """Return the pids of running Steam processes."""
+    return list(_iter_steam_pids())
+
+def _steam_running() -> bool:
+    """Return True as soon as any Steam process is found."""
+    return any(_iter_steam_pids())
+
+def _wait_for_exit(pids: List[int], timeout: float) -> List[int]:
+    """Wait up to timeout seconds for pids to exit and return the ones still running.
+
+    Uses pidfds, so it returns as soon as the last process is gone. Raises
+    OSError when pidfd_open is unavailable (kernels older than 5.3).
+    """
+    if not hasattr(os, 'pidfd_open'):
+        raise OSError(errno.ENOSYS, "pidfd_open is not available")
+    
+    poller = select.poll()
+    pidfds = {}
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                continue  # already exited
+            pidfds[fd] = pid
+            poller.register(fd, select.POLLIN)
+        
+        deadline = time.monotonic() + timeout
+        while pidfds:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                break
+            for fd, _ in poller.poll(remaining_ms):
+                poller.unregister(fd)
+                del pidfds[fd]
+                os.close(fd)
+        return list(pidfds.values())
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
 class DependencyManager:
     """Manages automatic detection and installation of dependencies."""
     
@@ -78,14 +461,9 @@ class DependencyManager:
             return self.detected_pm
             
         for pm_name, commands in self.package_managers.items():
-            for cmd in commands:
-                try:
-                    result = subprocess.run(['which', cmd], capture_output=True, text=True)
-                    if result.returncode == 0:
-                        self.detected_pm = pm_name
-                        return pm_name
-                except Exception:
-                    continue
+            if any(shutil.which(cmd) for cmd in commands):
+                self.detected_pm = pm_name
+                return pm_name
         return None
     
     def detect_distro(self) -> str:
@@ -161,8 +539,7 @@ class DependencyManager:
                 try:
                     # Check if pip command exists
                     check_cmd = pip_cmd.split()[0] if ' ' not in pip_cmd else pip_cmd.split()[-1]
-                    result = subprocess.run(['which', check_cmd], capture_output=True)
-                    if result.returncode != 0:
+                    if not shutil.which(check_cmd):
                         continue
                     
                     print(f"🔧 Installing {pip_name} using {pip_cmd}...")
@@ -213,12 +590,8 @@ class DependencyManager:
         if not package_name:
             package_name = tool_name
             
-        try:
-            result = subprocess.run(['which', tool_name], capture_output=True, text=True)
-            if result.returncode == 0:
-                return True
-        except Exception:
-            pass
+        if shutil.which(tool_name):
+            return True
         
         print(f"❌ Missing system tool: {tool_name}")
         
@@ -290,14 +663,7 @@ class DependencyManager:
     def setup_clipboard_app(self) -> bool:
         """Set up clipboard functionality by installing a clipboard app."""
         # Check if any clipboard app is already installed
-        installed_apps = []
-        for app_name, app_info in self.clipboard_apps.items():
-            try:
-                result = subprocess.run(['which', app_name], capture_output=True, text=True)
-                if result.returncode == 0:
-                    installed_apps.append(app_name)
-            except Exception:
-                pass
+        installed_apps = [app_name for app_name in self.clipboard_apps if shutil.which(app_name)]
         
         if installed_apps:
             print(f"✅ Found clipboard app(s): {', '.join(installed_apps)}")
@@ -399,14 +765,9 @@ class DependencyManager:
         
         missing_tools = []
         for tool_name, package_name in system_tools.items():
-            try:
-                result = subprocess.run(['which', tool_name], capture_output=True, text=True)
-                if result.returncode == 0:
-                    print(f"✅ {tool_name} found")
-                else:
-                    missing_tools.append((tool_name, package_name))
-                    print(f"❌ {tool_name} not found")
-            except Exception:
+            if shutil.which(tool_name):
+                print(f"✅ {tool_name} found")
+            else:
                 missing_tools.append((tool_name, package_name))
                 print(f"❌ {tool_name} not found")
         
@@ -430,14 +791,10 @@ class DependencyManager:
         terminals = ['konsole', 'gnome-terminal', 'xfce4-terminal', 'alacritty', 'kitty', 'terminator', 'xterm']
         
         for terminal in terminals:
-            try:
-                result = subprocess.run(['which', terminal], capture_output=True, text=True)
-                if result.returncode == 0:
-                    terminal_found = True
-                    print(f"✅ Found terminal: {terminal}")
-                    break
-            except Exception:
-                pass
+            if shutil.which(terminal):
+                terminal_found = True
+                print(f"✅ Found terminal: {terminal}")
+                break
         
         if not terminal_found:
             print("⚠️ No common terminal emulator found - OptiScaler setup scripts may need manual execution")
@@ -456,15 +813,72 @@ if not dep_manager.check_python_module('requests'):
 # Now we can safely import requests
 import requests
 
+# Optional: py7zr extracts .7z archives in-process; without it we shell out to 7z
+try:
+    import py7zr
+except ImportError:
+    py7zr = None
+
 class OptiScalerManager:
+    # Terminal emulators in order of preference; {wd} and {script} are filled in per launch
+    _TERMINALS = (
+        ("konsole", "--workdir", "{wd}", "-e", "{script}"),
+        ("gnome-terminal", "--working-directory", "{wd}", "--", "{script}"),
+        ("xfce4-terminal", "--working-directory", "{wd}", "-e", "{script}"),
+        ("alacritty", "--working-directory", "{wd}", "-e", "{script}"),
+        ("kitty", "--directory", "{wd}", "{script}"),
+        ("terminator", "--working-directory", "{wd}", "-e", "{script}"),
+        ("xterm", "-e", "cd '{wd}' && {script}"),
+    )
+
     def __init__(self):
         self.config_dir = Path.home() / ".config" / "optiscaler_manager"
         self.config_dir.mkdir(parents=True, exist_ok=True)
         self.installs_file = self.config_dir / "installations.json"
-        self.steam_path = self._find_steam_path()
         self.github_api_url = "https://api.github.com/repos/optiscaler/OptiScaler/releases"
-        self.fsr4_dll_path = self._find_fsr4_dll()
-        
+        # One keep-alive session so the API call and asset download share connections
+        self._http = requests.Session()
+        self._http.mount("https://", requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=2))
+        # Contents of installs_file, loaded on first use
+        self._installs = None
+        # get_launch_options_catalog results keyed by (rdna3_workaround, include_mangohud)
+        self._catalogs: Dict[Tuple[bool, bool], Dict[str, Dict]] = {}
+
+    @cached_property
+    def steam_path(self) -> Optional[Path]:
+        """Steam installation directory, located on first access."""
+        return self._find_steam_path()
+
+    @cached_property
+    def fsr4_dll_path(self) -> Optional[Path]:
+        """FSR4 DLL location, located on first access.
+
+        Assigning to this attribute (e.g. after a version is selected) replaces
+        the cached value.
+        """
+        return self._find_fsr4_dll()
+
+    @cached_property
+    def _steam_launcher(self) -> Optional[List[str]]:
+        """First available command for starting Steam, resolved once per session."""
+        start_commands = [
+            ["steam"],
+            ["/usr/bin/steam"],
+            ["flatpak", "run", "com.valvesoftware.Steam"],
+            ["snap", "run", "steam"]
+        ]
+        return next((cmd for cmd in start_commands if shutil.which(cmd[0])), None)
+
+    @cached_property
+    def _terminal(self) -> Optional[Tuple[str, ...]]:
+        """Argv template of the first installed terminal emulator, resolved once per session."""
+        return next((t for t in self._TERMINALS if shutil.which(t[0])), None)
+
+    @cached_property
+    def _mangohud_available(self) -> bool:
+        """Whether mangohud is on PATH, resolved once per session."""
+        return shutil.which('mangohud') is not None
+
     def _find_steam_path(self) -> Optional[Path]:
         steam_paths = [
             Path.home() / ".steam" / "steam",
@@ -498,8 +912,7 @@ class OptiScalerManager:
                         content = f.read()
                     
                     # Parse VDF format to find library paths
-                    import re
-                    path_matches = re.findall(r'"path"\s*"([^"]+)"', content)
+                    path_matches = _LIBRARY_PATH_RE.findall(content)
                     for path_str in path_matches:
                         library_path = Path(path_str)
                         if library_path.exists() and library_path not in libraries:
@@ -655,49 +1068,39 @@ class OptiScalerManager:
         return list(set(matches))
 
     def _find_fsr4_dll(self) -> Optional[Path]:
-        # Check config directory first (user's selected version)
-        config_dll = self.config_dir / "amdxcffx64.dll"
-        if config_dll.exists():
-            return config_dll
-            
-        search_paths = [
+        home = os.path.expanduser("~")
+        search_paths = (
+            # Config directory first (user's selected version)
+            os.path.join(self.config_dir, "amdxcffx64.dll"),
             # Current directory
-            Path.cwd() / "amdxcffx64.dll",
+            os.path.join(os.getcwd(), "amdxcffx64.dll"),
             # Script directory
-            Path(__file__).parent / "amdxcffx64.dll",
+            os.path.join(os.path.dirname(os.path.abspath(__file__)), "amdxcffx64.dll"),
             # Common locations
-            Path.home() / "Downloads" / "amdxcffx64.dll",
-            Path("/usr/lib/amdxcffx64.dll"),
-            Path("/usr/local/lib/amdxcffx64.dll"),
+            os.path.join(home, "Downloads", "amdxcffx64.dll"),
+            "/usr/lib/amdxcffx64.dll",
+            "/usr/local/lib/amdxcffx64.dll",
             # Search in common FSR directories
-            Path.home() / "Documents" / "fsr4" / "FSR 4.0" / "FSR 4.0.1" / "amdxcffx64.dll",
-        ]
+            os.path.join(home, "Documents", "fsr4", "FSR 4.0", "FSR 4.0.1", "amdxcffx64.dll"),
+        )
         
+        # Plain string checks, one stat each; only the hit becomes a Path
         for path in search_paths:
-            if path.exists():
-                return path
-        
-        # Search for FSR directories and bundled versions
-        fsr_search_dirs = [
-            Path.cwd() / "fsr4_dlls",  # Bundled with script
-            Path(__file__).parent / "fsr4_dlls",  # Script directory
-            Path.home() / "Documents" / "fsr4",
-            Path.home() / "Downloads",
-        ]
-        
-        for search_dir in fsr_search_dirs:
-            if search_dir.exists():
-                for fsr_dir in search_dir.rglob("*FSR*"):
-                    if fsr_dir.is_dir():
-                        dll_file = fsr_dir / "amdxcffx64.dll"
-                        if dll_file.exists():
-                            return dll_file
+            if os.path.exists(path):
+                return Path(path)
         
-        return None
+        # Fall back to the first bundled version; this shares the (cached) scan
+        # of the FSR search directories with find_available_fsr4_versions
+        return next(iter(self.find_available_fsr4_versions().values()), None)
 
     def find_available_fsr4_versions(self) -> Dict[str, Path]:
-        versions = {}
-        
+        """Map version names to FSR4 DLLs found in the bundled and user search directories.
+
+        The scan is cached until the mtime of a search directory changes, which
+        happens when a version directory is added, removed or renamed. A DLL
+        added inside an existing version directory is not seen until
+        select_fsr4_version or download_fsr4_dll clears the cache.
+        """
         # Search for bundled FSR4 DLLs
         fsr_search_dirs = [
             Path.cwd() / "fsr4_dlls",
@@ -706,24 +1109,53 @@ class OptiScalerManager:
             Path.home() / "Downloads",
         ]
         
+        # Reuse the last scan while none of the search directories has changed
+        key = []
         for search_dir in fsr_search_dirs:
-            if not search_dir.exists():
-                continue
-                
-            # Look for version directories
-            for version_dir in search_dir.iterdir():
-                if version_dir.is_dir():
-                    dll_file = version_dir / "amdxcffx64.dll"
-                    if dll_file.exists():
-                        version_name = version_dir.name
-                        versions[version_name] = dll_file
-            
-            # Also check direct DLL files with version names
-            for dll_file in search_dir.glob("**/amdxcffx64*.dll"):
-                if dll_file.exists():
-                    parent_name = dll_file.parent.name
-                    if "4.0" in parent_name or "FSR" in parent_name:
-                        versions[parent_name] = dll_file
+            try:
+                key.append((str(search_dir), os.stat(search_dir).st_mtime_ns))
+            except OSError:
+                key.append((str(search_dir), None))
+        key = tuple(key)
+        
+        versions = _fsr4_versions_cache.get(key)
+        if versions is None:
+            versions = self._scan_fsr4_versions(fsr_search_dirs)
+            _fsr4_versions_cache.clear()
+            _fsr4_versions_cache[key] = versions
+        return dict(versions)
+
+    def _scan_fsr4_versions(self, fsr_search_dirs: List[Path]) -> Dict[str, Path]:
+        # One walk per search dir, merged in search-dir order. Within a dir,
+        # amdxcffx64.dll directly inside a version directory comes first (in
+        # directory listing order), then amdxcffx64*.dll found deeper under an
+        # FSR-looking parent, which overrides a direct match of the same name
+        versions = {}
+        
+        for search_dir in fsr_search_dirs:
+            search_dir_s = os.fspath(search_dir)
+            listing_order = {}
+            direct = {}
+            nested = {}
+            for entry in _walk(search_dir_s, max_depth=3):
+                name = entry.name
+                parent_path = os.path.dirname(entry.path)
+                if parent_path == search_dir_s:
+                    # The top level is listed completely before the walk descends
+                    listing_order[name] = len(listing_order)
+                if not (name.startswith("amdxcffx64") and name.endswith(".dll")):
+                    continue
+                if not entry.is_file():
+                    continue
+                parent_name = os.path.basename(parent_path)
+                if (name == "amdxcffx64.dll"
+                        and os.path.dirname(parent_path) == search_dir_s):
+                    direct[parent_name] = Path(entry.path)
+                if _FSR4_DIR_RE.search(parent_name):
+                    nested[parent_name] = Path(entry.path)
+            
+            versions.update(sorted(direct.items(), key=lambda item: listing_order[item[0]]))
+            versions.update(nested)
         
         return versions
 
@@ -737,9 +1169,8 @@ class OptiScalerManager:
         print("\n=== Available FSR4 DLL Versions ===")
         version_list = list(versions.items())
         
-        for i, (version_name, dll_path) in enumerate(version_list, 1):
-            print(f"{i}. {version_name}")
-            print(f"   Path: {dll_path}")
+        print("\n".join(f"{i}. {version_name}\n   Path: {dll_path}"
+                        for i, (version_name, dll_path) in enumerate(version_list, 1)))
         
         print(f"{len(version_list) + 1}. Browse for custom DLL")
         print(f"{len(version_list) + 2}. Cancel")
@@ -752,12 +1183,13 @@ class OptiScalerManager:
                 
                 # Copy selected version to config directory
                 target_dll = self.config_dir / "amdxcffx64.dll"
-                shutil.copy2(selected_path, target_dll)
+                _fast_copy(selected_path, target_dll)
                 
                 print(f"✓ Selected FSR4 version: {selected_version}")
                 print(f"✓ Copied to: {target_dll}")
                 
                 self.fsr4_dll_path = target_dll
+                _fsr4_versions_cache.clear()
                 return True
                 
             elif choice == len(version_list) + 1:
@@ -787,8 +1219,9 @@ class OptiScalerManager:
             if source_dll.exists():
                 target_dll = self.config_dir / "amdxcffx64.dll"
                 try:
-                    shutil.copy2(source_dll, target_dll)
+                    _fast_copy(source_dll, target_dll)
                     self.fsr4_dll_path = target_dll
+                    _fsr4_versions_cache.clear()
                     print(f"Copied amdxcffx64.dll to {target_dll}")
                     return True
                 except Exception as e:
@@ -821,96 +1254,103 @@ class OptiScalerManager:
             # Find all manifest files in this library (with NTFS support)
             manifest_files = self._safe_case_insensitive_glob(steamapps_path, "appmanifest_*.acf")
             
-            for manifest_file in manifest_files:
-                try:
-                    with open(manifest_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                    
-                    app_id = None
-                    name = None
-                    install_dir = None
-                    
-                    for line in content.split('\n'):
-                        line = line.strip()
-                        if line.startswith('"appid"'):
-                            app_id = line.split('"')[3]
-                        elif line.startswith('"name"'):
-                            name = line.split('"')[3]
-                        elif line.startswith('"installdir"'):
-                            install_dir = line.split('"')[3]
-                    
-                    if app_id and name and install_dir:
-                        game_path = steamapps_path / "common" / install_dir
-                        if game_path.exists():
-                            # Check if we already have this game from another library
-                            existing_game = next((g for g in games if g["app_id"] == app_id), None)
-                            if not existing_game:
-                                games.append({
-                                    "app_id": app_id,
-                                    "name": name,
-                                    "install_dir": install_dir,
-                                    "path": str(game_path),
-                                    "library_path": str(library_path)
-                                })
-                            else:
-                                # Game exists in multiple libraries, keep the one with more recent activity
-                                try:
-                                    existing_mtime = Path(existing_game["path"]).stat().st_mtime
-                                    current_mtime = game_path.stat().st_mtime
-                                    if current_mtime > existing_mtime:
-                                        # Replace with more recent version
-                                        for i, game in enumerate(games):
-                                            if game["app_id"] == app_id:
-                                                games[i] = {
-                                                    "app_id": app_id,
-                                                    "name": name,
-                                                    "install_dir": install_dir,
-                                                    "path": str(game_path),
-                                                    "library_path": str(library_path)
-                                                }
-                                                break
-                                except OSError:
-                                    pass  # Can't get mtime, keep existing
-                                    
-                except Exception as e:
-                    print(f"Error reading manifest {manifest_file}: {e}")
+            # Read and parse the manifests concurrently; merging stays in order below
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                parsed_manifests = list(pool.map(self._parse_manifest, manifest_files))
+            
+            for fields in parsed_manifests:
+                if fields is None:
+                    continue
+                app_id, name, install_dir = fields
+                
+                game_path = steamapps_path / "common" / install_dir
+                if game_path.exists():
+                    # Check if we already have this game from another library
+                    existing_game = next((g for g in games if g["app_id"] == app_id), None)
+                    if not existing_game:
+                        games.append({
+                            "app_id": app_id,
+                            "name": name,
+                            "install_dir": install_dir,
+                            "path": str(game_path),
+                            "library_path": str(library_path)
+                        })
+                    else:
+                        # Game exists in multiple libraries, keep the one with more recent activity
+                        try:
+                            existing_mtime = Path(existing_game["path"]).stat().st_mtime
+                            current_mtime = game_path.stat().st_mtime
+                            if current_mtime > existing_mtime:
+                                # Replace with more recent version
+                                for i, game in enumerate(games):
+                                    if game["app_id"] == app_id:
+                                        games[i] = {
+                                            "app_id": app_id,
+                                            "name": name,
+                                            "install_dir": install_dir,
+                                            "path": str(game_path),
+                                            "library_path": str(library_path)
+                                        }
+                                        break
+                        except OSError:
+                            pass  # Can't get mtime, keep existing
         
         print(f"Found {len(games)} games across all Steam libraries")
-        return sorted(games, key=lambda x: x["name"])
+        return sorted(games, key=itemgetter("name"))
+
+    def _parse_manifest(self, manifest_file: Path) -> Optional[Tuple[str, str, str]]:
+        """Return (app_id, name, install_dir) from an appmanifest_*.acf, or None if incomplete."""
+        try:
+            with open(manifest_file, 'rb') as f:
+                fields = dict(_MANIFEST_RE.findall(f.read()))
+            
+            app_id = fields.get(b'appid', b'').decode('utf-8')
+            name = fields.get(b'name', b'').decode('utf-8')
+            install_dir = fields.get(b'installdir', b'').decode('utf-8')
+        except Exception as e:
+            print(f"Error reading manifest {manifest_file}: {e}")
+            return None
+        
+        if app_id and name and install_dir:
+            return app_id, name, install_dir
+        return None
 
     def find_game_executable_paths(self, game_path: str) -> List[Dict[str, str]]:
         """Find all possible executable locations with details about what's in each folder"""
-        game_dir = Path(game_path)
+        # Work on plain strings; Path objects are only needed by callers
+        game_dir = str(Path(game_path))
         exe_locations = []
         
-        # Find all executable files and analyze them
-        for exe_file in game_dir.rglob("*.exe"):
-            if not exe_file.is_file():
+        # Lowercased parent paths, computed once per directory
+        parent_lower_cache = {}
+        
+        # Find all executable files and analyze them; every .exe below a skipped
+        # directory would be rejected anyway, so those subtrees are never walked
+        for entry in _walk(game_dir, max_depth=6, prune=_EXE_SKIP_DIR_RE.search):
+            if not entry.name.endswith(".exe") or not entry.is_file():
                 continue
-                
-            # Skip obvious non-game executables
-            skip_paths = ["engine", "redist", "directx", "vcredist", "_commonredist", "tools", "crash"]
-            skip_names = ["unins", "setup", "launcher", "redist", "vcredist", "directx", "crash"]
             
-            path_str = str(exe_file.parent).lower()
-            name_str = exe_file.name.lower()
+            parent = os.path.dirname(entry.path)
+            path_str = parent_lower_cache.get(parent)
+            if path_str is None:
+                path_str = parent_lower_cache.setdefault(parent, parent.lower())
+            name_str = entry.name.lower()
             
-            # Skip if in excluded paths or has excluded names
-            if (any(skip in path_str for skip in skip_paths) or 
-                any(skip in name_str for skip in skip_names)):
+            # Skip obvious non-game executables (excluded paths or names)
+            if _EXE_SKIP_DIR_RE.search(path_str) or _EXE_SKIP_NAME_RE.search(name_str):
                 continue
             
             # Determine the type/priority of this executable
             exe_type = "Other"
             priority = 3
             
-            if exe_file.parent == game_dir:
+            if parent == game_dir:
                 exe_type = "Main Game Directory"
                 priority = 1
             elif "_shipping" in name_str:
                 exe_type = "Shipping Executable (UE)"
                 priority = 1
-            elif any(folder in str(exe_file.parent).lower() for folder in ["bin/x64", "retail", "binaries/win64"]):
+            elif any(folder in path_str for folder in _EXE_COMMON_FOLDERS):
                 exe_type = "Common Game Folder"
                 priority = 2
             elif "ue4" in name_str or "ue5" in name_str:
@@ -918,11 +1358,11 @@ class OptiScalerManager:
             
             # Create location info
             location_info = {
-                "path": str(exe_file.parent),
-                "exe_name": exe_file.name,
+                "path": parent,
+                "exe_name": entry.name,
                 "type": exe_type,
                 "priority": priority,
-                "relative_path": str(exe_file.parent.relative_to(game_dir))
+                "relative_path": parent[len(game_dir) + 1:] or "."
             }
             
             # Check if we already have this path
@@ -935,7 +1375,7 @@ class OptiScalerManager:
                 exe_locations.append(location_info)
         
         # Sort by priority (lower number = higher priority) then by path depth
-        exe_locations.sort(key=lambda x: (x["priority"], len(Path(x["path"]).parts), x["path"]))
+        exe_locations.sort(key=lambda x: (x["priority"], x["path"].count(os.sep), x["path"]))
         
         return exe_locations
 
@@ -948,8 +1388,11 @@ class OptiScalerManager:
             return compatdata_path
         return None
 
-    def copy_fsr4_dll_to_compatdata(self, app_id: str) -> bool:
+    def copy_fsr4_dll_to_compatdata(self, app_id: str, prompt: bool = True) -> bool:
         if not self.fsr4_dll_path or not self.fsr4_dll_path.exists():
+            if not prompt:
+                print("FSR4 DLL not selected - skipping copy to compatdata")
+                return False
             print("FSR4 DLL not found. Please select a version...")
             if not self.select_fsr4_version():
                 return False
@@ -965,53 +1408,93 @@ class OptiScalerManager:
         target_dll = system32_path / "amdxcffx64.dll"
         
         try:
-            shutil.copy2(self.fsr4_dll_path, target_dll)
+            _fast_copy(self.fsr4_dll_path, target_dll)
             print(f"Copied amdxcffx64.dll to {target_dll}")
             return True
         except Exception as e:
             print(f"Error copying FSR4 DLL: {e}")
             return False
 
-    def download_latest_nightly(self) -> Optional[str]:
+    def _fetch_releases(self) -> List[Dict]:
+        """Fetch the release list, reusing the cached copy when GitHub reports no change.
+
+        A cached list younger than _RELEASES_TTL is returned without any request.
+        """
+        etag_file = self.config_dir / "releases.etag"
+        cache_file = self.config_dir / "releases.json"
+        
+        # An unreadable or corrupt cache counts as a miss, refetched unconditionally
         try:
-            response = requests.get(self.github_api_url)
+            cache_age = time.time() - cache_file.stat().st_mtime
+            with open(cache_file, 'r') as f:
+                cached = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            cache_age, cached = None, None
+        if cached is not None and cache_age < _RELEASES_TTL:
+            return cached
+        
+        headers = {"Accept": "application/vnd.github+json"}
+        if cached is not None and etag_file.exists():
+            headers["If-None-Match"] = etag_file.read_text().strip()
+        
+        response = self._http.get(self.github_api_url, headers=headers, timeout=(5, 60))
+        if response.status_code == 304 and cached is not None:
+            os.utime(cache_file)  # revalidated, restart the TTL
+            return cached
+        
+        response.raise_for_status()
+        releases = response.json()
+        
+        # Each file is swapped in whole, the body first so an etag never
+        # vouches for a body that was not written
+        etag = response.headers.get("ETag")
+        if etag:
+            _replace_file(cache_file, response.content)
+            _replace_file(etag_file, etag.encode())
+        
+        return releases
+
+    def _download_asset(self, asset: Dict) -> str:
+        """Stream a release asset into the config directory and return its path.
+
+        The body goes to a .part file that is renamed into place once complete,
+        so an interrupted download never leaves a truncated archive behind.
+        """
+        download_path = self.config_dir / asset["name"]
+        part_path = download_path.with_name(download_path.name + ".part")
+        
+        with self._http.get(asset["browser_download_url"], stream=True, timeout=(5, 60)) as response:
             response.raise_for_status()
-            releases = response.json()
-            
-            for release in releases:
-                if release.get("latest", False) or release.get("tag_name") == "latest":
-                    for asset in release["assets"]:
-                        if asset["name"].endswith((".zip", ".7z")):
-                            download_url = asset["browser_download_url"]
-                            filename = asset["name"]
-                            
-                            print(f"Downloading {filename}...")
-                            zip_response = requests.get(download_url)
-                            zip_response.raise_for_status()
-                            
-                            download_path = self.config_dir / filename
-                            with open(download_path, "wb") as f:
-                                f.write(zip_response.content)
-                            
-                            return str(download_path)
-            
-            # If no nightly found, try latest stable release
-            if releases:
-                latest_release = releases[0]
-                for asset in latest_release["assets"]:
-                    if asset["name"].endswith((".zip", ".7z")):
-                        download_url = asset["browser_download_url"]
-                        filename = asset["name"]
-                        
-                        print(f"No nightly found, downloading latest stable: {filename}...")
-                        zip_response = requests.get(download_url)
-                        zip_response.raise_for_status()
-                        
-                        download_path = self.config_dir / filename
-                        with open(download_path, "wb") as f:
-                            f.write(zip_response.content)
-                        
-                        return str(download_path)
+            response.raw.decode_content = True
+            try:
+                with open(part_path, "wb", buffering=1 << 20) as f:
+                    shutil.copyfileobj(response.raw, f, 1 << 20)
+                os.replace(part_path, download_path)
+            except BaseException:
+                part_path.unlink(missing_ok=True)
+                raise
+        
+        return str(download_path)
+
+    def download_latest_nightly(self) -> Optional[str]:
+        try:
+            releases = self._fetch_releases()
+            
+            nightly_asset = next((asset for release in releases
+                                  if release.get("latest", False) or release.get("tag_name") == "latest"
+                                  for asset in release["assets"]
+                                  if asset["name"].endswith((".zip", ".7z"))), None)
+            if nightly_asset:
+                asset, message = nightly_asset, "Downloading"
+            else:
+                # If no nightly found, try latest stable release
+                asset = next((asset for asset in releases[0]["assets"]
+                              if asset["name"].endswith((".zip", ".7z"))), None) if releases else None
+                message = "No nightly found, downloading latest stable:"
+            
+            if asset:
+                print(f"{message} {asset['name']}...")
+                return self._download_asset(asset)
             
             print("No releases found")
             return None
@@ -1025,6 +1508,15 @@ class OptiScalerManager:
             archive_file = Path(archive_path)
             
             if archive_file.suffix.lower() == '.7z':
+                if py7zr is not None:
+                    try:
+                        with py7zr.SevenZipFile(archive_path, 'r') as archive:
+                            archive.extractall(target_dir)
+                        return True
+                    except Exception as e:
+                        # e.g. BCJ2 or other filters py7zr does not support; 7z may still manage
+                        print(f"py7zr could not extract the archive ({e}), trying 7z...")
+                
                 # Use 7z command to extract
                 result = subprocess.run(['7z', 'x', archive_path, f'-o{target_dir}', '-y'], 
                                       capture_output=True, text=True)
@@ -1032,9 +1524,8 @@ class OptiScalerManager:
                     print(f"7z extraction failed: {result.stderr}")
                     return False
             else:
-                # Use zipfile for .zip files
-                with zipfile.ZipFile(archive_path, 'r') as zip_ref:
-                    zip_ref.extractall(target_dir)
+                # Use zipfile for .zip files, extracting members in parallel
+                _extract_zip(archive_path, target_dir)
             
             return True
         except FileNotFoundError:
@@ -1046,23 +1537,30 @@ class OptiScalerManager:
 
     def backup_original_files(self, target_dir: str) -> Dict[str, str]:
         backup_map = {}
-        target_path = Path(target_dir)
-        
-        files_to_backup = [
-            "nvngx.dll", "libxess.dll", "amd_fidelityfx_fsr2.dll", 
-            "amd_fidelityfx_fsr3.dll", "ffx_fsr2_api_x64.dll"
-        ]
         
-        for filename in files_to_backup:
-            original_file = target_path / filename
-            if original_file.exists():
-                backup_file = target_path / f"{filename}.optiscaler_backup"
-                shutil.copy2(original_file, backup_file)
-                backup_map[filename] = str(backup_file)
+        # One directory listing instead of probing every candidate name
+        try:
+            with os.scandir(target_dir) as it:
+                present = [entry for entry in it
+                           if entry.name in _FILES_TO_BACKUP and entry.is_file()]
+        except OSError:
+            return backup_map
+        
+        # The originals are about to be overwritten, so moving them aside is enough
+        for entry in present:
+            backup_file = f"{entry.path}.optiscaler_backup"
+            os.rename(entry.path, backup_file)
+            backup_map[entry.name] = backup_file
         
         return backup_map
 
-    def install_optiscaler(self, game_info: Dict, exe_location: Dict, zip_path: str) -> bool:
+    def install_optiscaler(self, game_info: Dict, exe_location: Dict, zip_path: str,
+                           run_setup: bool = True) -> bool:
+        """Install OptiScaler into exe_location and record the installation.
+
+        With run_setup False nothing waits for the user: the setup scripts are
+        skipped and the FSR4 DLL is only copied if a version is already selected.
+        """
         target_dir = Path(exe_location["path"])
         
         print(f"Installing OptiScaler to: {target_dir}")
@@ -1072,25 +1570,37 @@ class OptiScalerManager:
         backup_map = self.backup_original_files(str(target_dir))
         
         if not self.extract_optiscaler(zip_path, str(target_dir)):
+            # Move the original files back over anything partially extracted
+            for original_name, backup_path in backup_map.items():
+                os.replace(backup_path, target_dir / original_name)
             return False
         
-        # Try to run Windows batch setup first if available
-        setup_bat = target_dir / "OptiScaler Setup.bat"
-        if setup_bat.exists():
-            try:
-                subprocess.run(["wine", str(setup_bat)], cwd=str(target_dir), check=True)
-                print("Windows setup completed successfully")
-            except subprocess.CalledProcessError:
-                print("Windows auto-setup failed, proceeding with Linux setup")
+        # Originals the archive did not replace are still needed by the game
+        for original_name, backup_path in backup_map.items():
+            original_path = target_dir / original_name
+            if not os.path.lexists(original_path):
+                shutil.copy2(backup_path, original_path)
         
-        # Run Linux setup script in the correct directory
-        self.run_optiscaler_setup(str(target_dir))
+        if run_setup:
+            # Try to run Windows batch setup first if available
+            setup_bat = target_dir / "OptiScaler Setup.bat"
+            if setup_bat.exists():
+                try:
+                    subprocess.run(["wine", str(setup_bat)], cwd=str(target_dir), check=True)
+                    print("Windows setup completed successfully")
+                except subprocess.CalledProcessError:
+                    print("Windows auto-setup failed, proceeding with Linux setup")
+            
+            # Run Linux setup script in the correct directory
+            self.run_optiscaler_setup(str(target_dir))
+        else:
+            print("Skipping OptiScaler setup script")
         
         # Configure INI file
         self.configure_optiscaler_ini(str(target_dir))
         
         # Copy FSR4 DLL to compatdata
-        fsr4_dll_copied = self.copy_fsr4_dll_to_compatdata(game_info["app_id"])
+        fsr4_dll_copied = self.copy_fsr4_dll_to_compatdata(game_info["app_id"], prompt=run_setup)
         
         install_info = {
             "game": game_info,
@@ -1109,13 +1619,8 @@ class OptiScalerManager:
         install_path = Path(install_dir)
         
         # Look for setup scripts (prioritize setup_linux.sh as it's the official name)
-        setup_scripts = [
-            install_path / "setup_linux.sh",
-            install_path / "OptiScaler Setup.sh", 
-            install_path / "setup.sh"
-        ]
-        
-        for setup_script in setup_scripts:
+        for script_name in _SETUP_SCRIPT_NAMES:
+            setup_script = install_path / script_name
             if setup_script.exists():
                 try:
                     print(f"Found OptiScaler setup script: {setup_script.name}")
@@ -1127,48 +1632,8 @@ class OptiScalerManager:
                     
                     print(f"Running setup script in directory: {install_path}")
                     
-                    # Try different terminal emulators in order of preference
-                    terminals = [
-                        ["konsole", "--workdir", str(install_path), "-e", str(setup_script)],
-                        ["gnome-terminal", "--working-directory", str(install_path), "--", str(setup_script)],
-                        ["xfce4-terminal", "--working-directory", str(install_path), "-e", str(setup_script)],
-                        ["alacritty", "--working-directory", str(install_path), "-e", str(setup_script)],
-                        ["kitty", "--directory", str(install_path), str(setup_script)],
-                        ["terminator", "--working-directory", str(install_path), "-e", str(setup_script)],
-                        ["xterm", "-e", f"cd '{install_path}' && {setup_script}"]
-                    ]
-                    
-                    script_launched = False
-                    for terminal_cmd in terminals:
-                        try:
-                            # Check if terminal exists
-                            subprocess.run(["which", terminal_cmd[0]], 
-                                         capture_output=True, check=True)
-                            
-                            # Launch the terminal with the setup script
-                            subprocess.Popen(terminal_cmd)
-                            print(f"Launched setup script in {terminal_cmd[0]}")
-                            script_launched = True
-                            
-                            # Wait for user to indicate completion
-                            input("\nPress Enter after you have completed the OptiScaler setup...")
-                            break
-                            
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            continue
-                    
-                    if not script_launched:
-                        print("No suitable terminal emulator found.")
-                        print(f"Please manually run: {setup_script}")
-                        print("Available terminal commands to try:")
-                        print("  konsole --workdir . -e ./setup_linux.sh")
-                        print("  gnome-terminal --working-directory . -- ./setup_linux.sh")
-                        print("  xterm -e './setup_linux.sh'")
-                        
-                        choice = input("\nHave you run the setup script manually? (y/n): ").lower()
-                        if choice != 'y':
-                            print("Please run the setup script before continuing.")
-                            return
+                    if not self._launch_script_in_terminal(setup_script, install_path, "setup"):
+                        return
                     
                 except Exception as e:
                     print(f"Error launching setup script: {e}")
@@ -1178,6 +1643,37 @@ class OptiScalerManager:
         else:
             print("No OptiScaler setup script found - manual configuration may be needed")
 
+    def _launch_script_in_terminal(self, script: Path, cwd: Path, action: str) -> bool:
+        """Run script in the preferred terminal and wait for the user to finish.
+
+        action names the script in prompts ("setup" or "removal"). Returns False
+        when no terminal is available and the user has not run it manually.
+        """
+        terminal = self._terminal
+        if terminal is not None:
+            terminal_cmd = [arg.format(wd=cwd, script=script) for arg in terminal]
+            
+            # Launch the terminal with the script
+            _spawn(terminal_cmd)
+            print(f"Launched {action} script in {terminal_cmd[0]}")
+            
+            # Wait for user to indicate completion
+            input(f"\nPress Enter after you have completed the OptiScaler {action}...")
+            return True
+        
+        print("No suitable terminal emulator found.")
+        print(f"Please manually run: {script}")
+        print("Available terminal commands to try:")
+        print(f"  konsole --workdir . -e ./{script.name}")
+        print(f"  gnome-terminal --working-directory . -- ./{script.name}")
+        print(f"  xterm -e './{script.name}'")
+        
+        choice = input(f"\nHave you run the {action} script manually? (y/n): ").lower()
+        if choice != 'y':
+            print(f"Please run the {action} script before continuing.")
+            return False
+        return True
+
     def configure_optiscaler_ini(self, install_dir: str):
         ini_path = Path(install_dir) / "OptiScaler.ini"
         
@@ -1195,67 +1691,67 @@ OverrideNvapiDll=auto
             with open(ini_path, 'w') as f:
                 f.write(ini_content)
             print("Created OptiScaler.ini with Fsr4Update=true")
+            content = ini_content
         else:
             print("OptiScaler.ini exists, updating Fsr4Update setting")
             
-            # Read the file manually to preserve formatting
+            # Edit the text directly so comments and formatting are preserved
             with open(ini_path, 'r') as f:
-                lines = f.readlines()
-            
-            # Find and update the Fsr4Update line
-            fsr4_found = False
-            for i, line in enumerate(lines):
-                if line.strip().startswith('Fsr4Update='):
-                    lines[i] = 'Fsr4Update=true\n'
-                    fsr4_found = True
-                    print("Updated existing Fsr4Update=true")
-                    break
+                content = f.read()
             
-            # If not found, add it to the OptiScaler section
-            if not fsr4_found:
-                in_optiscaler_section = False
-                for i, line in enumerate(lines):
-                    if line.strip() == '[OptiScaler]':
-                        in_optiscaler_section = True
-                        continue
-                    if in_optiscaler_section and (line.startswith('[') or i == len(lines) - 1):
-                        # Insert before next section or at end
-                        insert_pos = i if line.startswith('[') else i + 1
-                        lines.insert(insert_pos, 'Fsr4Update=true\n')
-                        print("Added Fsr4Update=true to OptiScaler section")
-                        break
+            # Update the Fsr4Update line in place
+            content, replaced = _INI_FSR4_UPDATE_RE.subn('Fsr4Update=true', content, count=1)
+            if replaced:
+                print("Updated existing Fsr4Update=true")
+            else:
+                # If not found, add it to the OptiScaler section
+                section = _INI_OPTISCALER_SECTION_RE.search(content)
+                if section:
+                    line = 'Fsr4Update=true\n' if section.group().endswith('\n') else '\nFsr4Update=true\n'
+                    content = content[:section.end()] + line + content[section.end():]
+                    print("Added Fsr4Update=true to OptiScaler section")
                 else:
                     # No OptiScaler section found, add it
-                    lines.append('\n[OptiScaler]\nFsr4Update=true\n')
+                    if content and not content.endswith('\n'):
+                        content += '\n'
+                    content += '\n[OptiScaler]\nFsr4Update=true\n'
                     print("Added new OptiScaler section with Fsr4Update=true")
             
             # Write back to file
             with open(ini_path, 'w') as f:
-                f.writelines(lines)
+                f.write(content)
         
-        # Verify the setting was applied
-        if ini_path.exists():
-            with open(ini_path, 'r') as f:
-                content = f.read()
-                if 'Fsr4Update=true' in content:
-                    print("✓ Confirmed: Fsr4Update=true is set in OptiScaler.ini")
-                else:
-                    print("⚠ Warning: Fsr4Update=true not found in OptiScaler.ini")
-                    print("INI content preview:")
-                    print(content[:500] + "..." if len(content) > 500 else content)
+        # Verify the setting was applied, on the text just written
+        if 'Fsr4Update=true' in content:
+            print("✓ Confirmed: Fsr4Update=true is set in OptiScaler.ini")
+        else:
+            print("⚠ Warning: Fsr4Update=true not found in OptiScaler.ini")
+            print("INI content preview:")
+            print(content[:500] + "..." if len(content) > 500 else content)
 
     def save_installation(self, install_info: Dict):
-        installs = self.load_installations()
-        installs.append(install_info)
-        
-        with open(self.installs_file, 'w') as f:
-            json.dump(installs, f, indent=2)
+        self.load_installations().append(install_info)
+        self._write_installations()
+
+    def remove_installation(self, index: int):
+        self.load_installations().pop(index)
+        self._write_installations()
 
     def load_installations(self) -> List[Dict]:
-        if self.installs_file.exists():
-            with open(self.installs_file, 'r') as f:
-                return json.load(f)
-        return []
+        """Installed games, read from disk on first use and kept in memory afterwards."""
+        if self._installs is None:
+            self._installs = []
+            if self.installs_file.exists():
+                with open(self.installs_file, 'r') as f:
+                    self._installs = json.load(f)
+        return self._installs
+
+    def _write_installations(self):
+        # Write to a temp file and swap it in so a crash never leaves half a file
+        temp_path = self.installs_file.with_suffix('.json.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(self._installs, f, indent=2)
+        os.replace(temp_path, self.installs_file)
 
     def uninstall_optiscaler(self, install_info: Dict) -> bool:
         install_path = Path(install_info["install_path"])
@@ -1263,46 +1759,32 @@ OverrideNvapiDll=auto
         # First, try to run the OptiScaler removal script if it exists
         self.run_optiscaler_removal_script(str(install_path))
         
-        # Then manually clean up any remaining files
-        optiscaler_files = [
-            "OptiScaler.dll", "OptiScaler.ini", "OptiScaler.log", "OptiScaler Setup.bat",
-            "setup_linux.sh", "setup_windows.bat", "remove_optiscaler.sh",
-            # Possible renamed OptiScaler DLL files
-            "dxgi.dll", "winmm.dll", "version.dll", "dbghelp.dll", 
-            "d3d12.dll", "wininet.dll", "winhttp.dll", "OptiScaler.asi",
-            # Other DLSS/FSR files that might get installed
-            "nvngx.dll", "libxess.dll", "amd_fidelityfx_fsr2.dll",
-            "amd_fidelityfx_fsr3.dll", "ffx_fsr2_api_x64.dll"
-        ]
-        
-        # Also remove directories created by OptiScaler
-        optiscaler_dirs = [
-            "D3D12_Optiscaler", "DlssOverrides", "Licenses"
-        ]
+        install_path_s = str(install_path)
         
+        # Then manually clean up any remaining files
         print("Cleaning up remaining OptiScaler files...")
-        for filename in optiscaler_files:
-            file_path = install_path / filename
-            if file_path.exists():
-                file_path.unlink()
-                print(f"Removed: {filename}")
+        removed = []
+        for filename in _OPTISCALER_FILES:
+            try:
+                os.unlink(os.path.join(install_path_s, filename))
+            except FileNotFoundError:
+                continue
+            removed.append(filename)
+        if removed:
+            print(f"Removed: {', '.join(removed)}")
         
         # Remove OptiScaler directories
-        for dirname in optiscaler_dirs:
-            dir_path = install_path / dirname
-            if dir_path.exists() and dir_path.is_dir():
-                import shutil
+        for dirname in _OPTISCALER_DIRS:
+            dir_path = os.path.join(install_path_s, dirname)
+            if os.path.isdir(dir_path):
                 shutil.rmtree(dir_path)
                 print(f"Removed directory: {dirname}")
         
         # Restore original backed up files
         print("Restoring original game files...")
         for original_name, backup_path in install_info.get("backup_files", {}).items():
-            backup_file = Path(backup_path)
-            original_file = install_path / original_name
-            
-            if backup_file.exists():
-                shutil.move(backup_file, original_file)
+            if os.path.exists(backup_path):
+                shutil.move(backup_path, os.path.join(install_path_s, original_name))
                 print(f"Restored: {original_name}")
         
         # Remove FSR4 DLL from compatdata
@@ -1315,14 +1797,8 @@ OverrideNvapiDll=auto
         install_path = Path(install_dir)
         
         # Look for removal scripts (prioritize remove_optiscaler.sh as it's created by setup_linux.sh)
-        removal_scripts = [
-            install_path / "remove_optiscaler.sh",
-            install_path / "uninstall_optiscaler.sh", 
-            install_path / "remove.sh",
-            install_path / "uninstall.sh"
-        ]
-        
-        for removal_script in removal_scripts:
+        for script_name in _REMOVAL_SCRIPT_NAMES:
+            removal_script = install_path / script_name
             if removal_script.exists():
                 try:
                     print(f"Found OptiScaler removal script: {removal_script.name}")
@@ -1334,48 +1810,8 @@ OverrideNvapiDll=auto
                     
                     print(f"Running removal script in directory: {install_path}")
                     
-                    # Try different terminal emulators in order of preference
-                    terminals = [
-                        ["konsole", "--workdir", str(install_path), "-e", str(removal_script)],
-                        ["gnome-terminal", "--working-directory", str(install_path), "--", str(removal_script)],
-                        ["xfce4-terminal", "--working-directory", str(install_path), "-e", str(removal_script)],
-                        ["alacritty", "--working-directory", str(install_path), "-e", str(removal_script)],
-                        ["kitty", "--directory", str(install_path), str(removal_script)],
-                        ["terminator", "--working-directory", str(install_path), "-e", str(removal_script)],
-                        ["xterm", "-e", f"cd '{install_path}' && {removal_script}"]
-                    ]
-                    
-                    script_launched = False
-                    for terminal_cmd in terminals:
-                        try:
-                            # Check if terminal exists
-                            subprocess.run(["which", terminal_cmd[0]], 
-                                         capture_output=True, check=True)
-                            
-                            # Launch the terminal with the removal script
-                            subprocess.Popen(terminal_cmd)
-                            print(f"Launched removal script in {terminal_cmd[0]}")
-                            script_launched = True
-                            
-                            # Wait for user to indicate completion
-                            input("\nPress Enter after you have completed the OptiScaler removal...")
-                            break
-                            
-                        except (subprocess.CalledProcessError, FileNotFoundError):
-                            continue
-                    
-                    if not script_launched:
-                        print("No suitable terminal emulator found.")
-                        print(f"Please manually run: {removal_script}")
-                        print("Available terminal commands to try:")
-                        print("  konsole --workdir . -e ./remove_optiscaler.sh")
-                        print("  gnome-terminal --working-directory . -- ./remove_optiscaler.sh")
-                        print("  xterm -e './remove_optiscaler.sh'")
-                        
-                        choice = input("\nHave you run the removal script manually? (y/n): ").lower()
-                        if choice != 'y':
-                            print("Please run the removal script before continuing.")
-                            return
+                    if not self._launch_script_in_terminal(removal_script, install_path, "removal"):
+                        return
                     
                     print("OptiScaler removal script completed.")
                     
@@ -1396,13 +1832,14 @@ OverrideNvapiDll=auto
         target_dll = system32_path / "amdxcffx64.dll"
         
         try:
-            if target_dll.exists():
-                target_dll.unlink()
-                print(f"Removed amdxcffx64.dll from {target_dll}")
-            return True
+            target_dll.unlink()
+            print(f"Removed amdxcffx64.dll from {target_dll}")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error removing FSR4 DLL: {e}")
             return False
+        return True
 
     def install_lsfg_vk(self) -> bool:
         """Install LSFG-VK (Lossless Scaling Frame Generation for Vulkan)"""
@@ -1651,14 +2088,32 @@ flow_scale = 1.0
         return catalog
 
     def get_launch_options_catalog(self, rdna3_workaround: bool = False, include_mangohud: bool = True) -> Dict[str, Dict]:
-        """Get a comprehensive catalog of launch options with categorization"""
-        optiscaler_base = 'WINEDLLOVERRIDES="dxgi=n,b"'
+        """Get a comprehensive catalog of launch options with categorization
+
+        The catalog only depends on the two flags, so each combination is built
+        once and the same dict is returned afterwards; treat it as read-only.
+        """
+        key = (bool(rdna3_workaround), bool(include_mangohud))
+        catalog = self._catalogs.get(key)
+        if catalog is None:
+            catalog = self._catalogs[key] = self._build_launch_options_catalog(*key)
+        return catalog
+
+    def _build_launch_options_catalog(self, rdna3_workaround: bool, include_mangohud: bool) -> Dict[str, Dict]:
+        # Build each command once; the MangoHUD variants just prefix them
+        basic_cmd = f'{_BASIC_ENV} %command%'
+        advanced_cmd = f'{_ADVANCED_ENV} %command%'
+        debug_cmd = f'{_OPTISCALER_BASE_ENV} PROTON_LOG=+all WINEDEBUG=+dll PROTON_FSR4_UPGRADE=1 %command%'
+        antilag_cmd = f'{_BASIC_ENV} RADV_PERFTEST=rt %command%'
+        fsr4_cmd = f'{_BASIC_ENV} RADV_PERFTEST=nggc,rt %command%'
+        ue_cmd = f'{_BASIC_ENV} -dx12 %command%'
+        no_fg_cmd = 'WINEDLLOVERRIDES="dxgi=n,b;nvngx=n,b" PROTON_FSR4_UPGRADE=1 %command%'
         
         catalog = {
             "basic": {
                 "name": "Basic OptiScaler",
                 "description": "Essential OptiScaler setup - recommended starting point",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 %command%',
+                "command": basic_cmd,
                 "category": "basic",
                 "compatibility": "All games",
                 "requirements": "OptiScaler installed"
@@ -1666,7 +2121,7 @@ flow_scale = 1.0
             "basic_mangohud": {
                 "name": "Basic + MangoHUD",
                 "description": "Basic OptiScaler with performance monitoring overlay",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 %command%',
+                "command": f'mangohud {basic_cmd}',
                 "category": "basic",
                 "compatibility": "All games",
                 "requirements": "OptiScaler installed, MangoHUD"
@@ -1674,7 +2129,7 @@ flow_scale = 1.0
             "advanced": {
                 "name": "Advanced OptiScaler",
                 "description": "Enhanced performance and compatibility settings",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 DXVK_ASYNC=1 PROTON_ENABLE_NVAPI=1 PROTON_HIDE_NVIDIA_GPU=0 VKD3D_CONFIG=dxr11,dxr WINE_CPU_TOPOLOGY=4:2 %command%',
+                "command": advanced_cmd,
                 "category": "advanced",
                 "compatibility": "Most games",
                 "requirements": "OptiScaler installed, DXVK"
@@ -1682,7 +2137,7 @@ flow_scale = 1.0
             "advanced_mangohud": {
                 "name": "Advanced + MangoHUD",
                 "description": "Advanced settings with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 DXVK_ASYNC=1 PROTON_ENABLE_NVAPI=1 PROTON_HIDE_NVIDIA_GPU=0 VKD3D_CONFIG=dxr11,dxr WINE_CPU_TOPOLOGY=4:2 %command%',
+                "command": f'mangohud {advanced_cmd}',
                 "category": "advanced",
                 "compatibility": "Most games",
                 "requirements": "OptiScaler installed, DXVK, MangoHUD"
@@ -1690,7 +2145,7 @@ flow_scale = 1.0
             "debug": {
                 "name": "Debug Mode",
                 "description": "Detailed logging for troubleshooting issues",
-                "command": f'{optiscaler_base} PROTON_LOG=+all WINEDEBUG=+dll PROTON_FSR4_UPGRADE=1 %command%',
+                "command": debug_cmd,
                 "category": "debug",
                 "compatibility": "All games",
                 "requirements": "OptiScaler installed"
@@ -1698,7 +2153,7 @@ flow_scale = 1.0
             "debug_mangohud": {
                 "name": "Debug + MangoHUD",
                 "description": "Debug mode with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_LOG=+all WINEDEBUG=+dll PROTON_FSR4_UPGRADE=1 %command%',
+                "command": f'mangohud {debug_cmd}',
                 "category": "debug",
                 "compatibility": "All games",
                 "requirements": "OptiScaler installed, MangoHUD"
@@ -1706,7 +2161,7 @@ flow_scale = 1.0
             "antilag": {
                 "name": "Anti-Lag 2",
                 "description": "Experimental latency reduction (AMD only)",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 RADV_PERFTEST=rt %command%',
+                "command": antilag_cmd,
                 "category": "experimental",
                 "compatibility": "AMD GPUs only",
                 "requirements": "OptiScaler installed, AMD GPU"
@@ -1714,7 +2169,7 @@ flow_scale = 1.0
             "antilag_mangohud": {
                 "name": "Anti-Lag 2 + MangoHUD",
                 "description": "Anti-Lag 2 with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 RADV_PERFTEST=rt %command%',
+                "command": f'mangohud {antilag_cmd}',
                 "category": "experimental",
                 "compatibility": "AMD GPUs only",
                 "requirements": "OptiScaler installed, AMD GPU, MangoHUD"
@@ -1722,7 +2177,7 @@ flow_scale = 1.0
             "fsr4_enhanced": {
                 "name": "FSR4 Enhanced",
                 "description": "Optimized FSR4 settings with enhanced performance",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 RADV_PERFTEST=nggc,rt %command%',
+                "command": fsr4_cmd,
                 "category": "fsr4",
                 "compatibility": "AMD GPUs (FSR4 capable)",
                 "requirements": "OptiScaler installed, AMD GPU, FSR4 DLL"
@@ -1730,7 +2185,7 @@ flow_scale = 1.0
             "fsr4_enhanced_mangohud": {
                 "name": "FSR4 Enhanced + MangoHUD",
                 "description": "FSR4 Enhanced with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 RADV_PERFTEST=nggc,rt %command%',
+                "command": f'mangohud {fsr4_cmd}',
                 "category": "fsr4",
                 "compatibility": "AMD GPUs (FSR4 capable)",
                 "requirements": "OptiScaler installed, AMD GPU, FSR4 DLL, MangoHUD"
@@ -1738,7 +2193,7 @@ flow_scale = 1.0
             "ue_dx12": {
                 "name": "Unreal Engine + DX12",
                 "description": "Optimized for Unreal Engine games with DirectX 12",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 -dx12 %command%',
+                "command": ue_cmd,
                 "category": "game_specific",
                 "compatibility": "Unreal Engine games",
                 "requirements": "OptiScaler installed, UE game"
@@ -1746,7 +2201,7 @@ flow_scale = 1.0
             "ue_dx12_mangohud": {
                 "name": "Unreal Engine + DX12 + MangoHUD",
                 "description": "UE DX12 optimization with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 -dx12 %command%',
+                "command": f'mangohud {ue_cmd}',
                 "category": "game_specific",
                 "compatibility": "Unreal Engine games",
                 "requirements": "OptiScaler installed, UE game, MangoHUD"
@@ -1754,7 +2209,7 @@ flow_scale = 1.0
             "no_dlss_fg": {
                 "name": "Disable DLSS Frame Generation",
                 "description": "For games with DLSS Frame Generation issues",
-                "command": f'WINEDLLOVERRIDES="dxgi=n,b;nvngx=n,b" PROTON_FSR4_UPGRADE=1 %command%',
+                "command": no_fg_cmd,
                 "category": "compatibility",
                 "compatibility": "Games with DLSS FG issues",
                 "requirements": "OptiScaler installed"
@@ -1762,7 +2217,7 @@ flow_scale = 1.0
             "no_dlss_fg_mangohud": {
                 "name": "Disable DLSS FG + MangoHUD",
                 "description": "DLSS FG disabled with performance monitoring",
-                "command": f'mangohud WINEDLLOVERRIDES="dxgi=n,b;nvngx=n,b" PROTON_FSR4_UPGRADE=1 %command%',
+                "command": f'mangohud {no_fg_cmd}',
                 "category": "compatibility",
                 "compatibility": "Games with DLSS FG issues",
                 "requirements": "OptiScaler installed, MangoHUD"
@@ -1775,10 +2230,7 @@ flow_scale = 1.0
             for key, option in catalog.items():
                 if "DXIL_SPIRV_CONFIG=wmma_rdna3_workaround" not in option["command"]:
                     rdna3_key = f"{key}_rdna3"
-                    rdna3_cmd = option["command"].replace(
-                        'WINEDLLOVERRIDES="dxgi=n,b"',
-                        'WINEDLLOVERRIDES="dxgi=n,b" DXIL_SPIRV_CONFIG=wmma_rdna3_workaround'
-                    )
+                    rdna3_cmd = option["command"].replace(_OPTISCALER_BASE_ENV, _RDNA3_BASE_ENV)
                     if "RADV_PERFTEST=" not in rdna3_cmd:
                         rdna3_cmd = rdna3_cmd.replace("PROTON_FSR4_UPGRADE=1", "PROTON_FSR4_UPGRADE=1 RADV_PERFTEST=nggc")
                     else:
@@ -1818,7 +2270,7 @@ flow_scale = 1.0
             combined_options[f"optiscaler_lsfg_{multiplier}x"] = {
                 "name": f"OptiScaler + LSFG-VK {multiplier}x",
                 "description": f"OptiScaler FSR4 upscaling with LSFG-VK {multiplier}x frame generation",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
+                "command": f'{_BASIC_ENV} ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
                 "category": "combined",
                 "compatibility": "Experimental - may cause conflicts",
                 "requirements": "OptiScaler installed, LSFG-VK installed, Lossless Scaling owned"
@@ -1827,7 +2279,7 @@ flow_scale = 1.0
             combined_options[f"optiscaler_lsfg_{multiplier}x_mangohud"] = {
                 "name": f"OptiScaler + LSFG-VK {multiplier}x + MangoHUD",
                 "description": f"OptiScaler FSR4 + LSFG-VK {multiplier}x with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
+                "command": f'mangohud {_BASIC_ENV} ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
                 "category": "combined",
                 "compatibility": "Experimental - may cause conflicts",
                 "requirements": "OptiScaler installed, LSFG-VK installed, MangoHUD, Lossless Scaling owned"
@@ -1838,7 +2290,7 @@ flow_scale = 1.0
             combined_options[f"advanced_optiscaler_lsfg_{multiplier}x"] = {
                 "name": f"Advanced OptiScaler + LSFG-VK {multiplier}x",
                 "description": f"Advanced OptiScaler settings with LSFG-VK {multiplier}x frame generation",
-                "command": f'{optiscaler_base} PROTON_FSR4_UPGRADE=1 DXVK_ASYNC=1 PROTON_ENABLE_NVAPI=1 PROTON_HIDE_NVIDIA_GPU=0 VKD3D_CONFIG=dxr11,dxr WINE_CPU_TOPOLOGY=4:2 ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
+                "command": f'{_ADVANCED_ENV} ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
                 "category": "combined",
                 "compatibility": "Experimental - may cause conflicts",
                 "requirements": "OptiScaler installed, LSFG-VK installed, DXVK, Lossless Scaling owned"
@@ -1847,7 +2299,7 @@ flow_scale = 1.0
             combined_options[f"advanced_optiscaler_lsfg_{multiplier}x_mangohud"] = {
                 "name": f"Advanced OptiScaler + LSFG-VK {multiplier}x + MangoHUD",
                 "description": f"Advanced OptiScaler + LSFG-VK {multiplier}x with performance monitoring",
-                "command": f'mangohud {optiscaler_base} PROTON_FSR4_UPGRADE=1 DXVK_ASYNC=1 PROTON_ENABLE_NVAPI=1 PROTON_HIDE_NVIDIA_GPU=0 VKD3D_CONFIG=dxr11,dxr WINE_CPU_TOPOLOGY=4:2 ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
+                "command": f'mangohud {_ADVANCED_ENV} ENABLE_LSFG=1 LSFG_MULTIPLIER={multiplier} %command%',
                 "category": "combined",
                 "compatibility": "Experimental - may cause conflicts",
                 "requirements": "OptiScaler installed, LSFG-VK installed, DXVK, MangoHUD, Lossless Scaling owned"
@@ -1871,16 +2323,8 @@ flow_scale = 1.0
         BOLD = '\033[1m'
         RESET = '\033[0m'
         
-        # Check if MangoHUD is available
-        mangohud_available = False
-        try:
-            result = subprocess.run(['which', 'mangohud'], capture_output=True, text=True)
-            mangohud_available = result.returncode == 0
-        except Exception:
-            pass
-        
         # Get launch options catalog
-        catalog = self.get_launch_options_catalog(rdna3_workaround, mangohud_available)
+        catalog = self.get_launch_options_catalog(rdna3_workaround, self._mangohud_available)
         
         if not auto_apply:
             # Display mode - show all options with colors
@@ -1936,21 +2380,21 @@ flow_scale = 1.0
             choice_index = 1
             index_map = {}
             
-            for cat_key in ["basic", "advanced", "lsfg_vk", "combined", "fsr4", "game_specific", "compatibility", "experimental", "debug"]:
+            category_names = {
+                "basic": "Basic Setup",
+                "advanced": "Advanced Options",
+                "lsfg_vk": "LSFG-VK Frame Generation",
+                "combined": "OptiScaler + LSFG-VK Combined",
+                "fsr4": "FSR4 Specific", 
+                "game_specific": "Game-Specific",
+                "compatibility": "Compatibility",
+                "experimental": "Experimental",
+                "debug": "Debug/Troubleshooting"
+            }
+            
+            for cat_key, cat_name in category_names.items():
                 if cat_key not in categories:
                     continue
-                    
-                cat_name = {
-                    "basic": "Basic Setup",
-                    "advanced": "Advanced Options",
-                    "lsfg_vk": "LSFG-VK Frame Generation",
-                    "combined": "OptiScaler + LSFG-VK Combined",
-                    "fsr4": "FSR4 Specific", 
-                    "game_specific": "Game-Specific",
-                    "compatibility": "Compatibility",
-                    "experimental": "Experimental",
-                    "debug": "Debug/Troubleshooting"
-                }[cat_key]
                 
                 print(f"\n{BOLD}{cat_name}{RESET}")
                 for key, option in categories[cat_key]:
@@ -1984,12 +2428,8 @@ flow_scale = 1.0
                     
                     confirm = input(f"\nApply this launch option to App ID {app_id}? (y/n): ").lower()
                     if confirm == 'y':
-                        if self.apply_steam_launch_options(app_id, selected_option['command']):
-                            print(f"✅ Launch options applied successfully!")
-                            return True
-                        else:
-                            print("❌ Failed to apply launch options")
-                            return False
+                        # apply_steam_launch_options reports the outcome itself
+                        return self.apply_steam_launch_options(app_id, selected_option['command'])
                     else:
                         print("Launch option application cancelled")
                         return False
@@ -2049,18 +2489,18 @@ flow_scale = 1.0
             print(f"✓ Found userdata directory: {userdata_path}")
             
             # Look for Steam user ID directories
-            user_dirs = [d for d in userdata_path.iterdir() if d.is_dir() and d.name.isdigit()]
+            newest_user_dir, user_dir_count = _newest_user_dir(userdata_path)
             
-            if not user_dirs:
+            if newest_user_dir is None:
                 print("❌ No Steam user directories found")
                 available_dirs = list(userdata_path.iterdir())
                 print(f"Available directories in userdata: {[d.name for d in available_dirs]}")
                 return False
             
-            print(f"✓ Found {len(user_dirs)} user directory(ies)")
+            print(f"✓ Found {user_dir_count} user directory(ies)")
             
-            # Use the first (or most recent) user directory
-            user_dir = max(user_dirs, key=lambda x: x.stat().st_mtime)
+            # Use the most recently modified user directory
+            user_dir = Path(newest_user_dir)
             print(f"🔍 Using user directory: {user_dir}")
             
             # Path to localconfig.vdf
@@ -2079,31 +2519,33 @@ flow_scale = 1.0
             # Check if Steam is running - we'll work with it running like Valve does
             steam_running = False
             try:
-                result = subprocess.run(['pgrep', '-f', 'steam'], capture_output=True, text=True)
-                if result.returncode == 0:
+                if _steam_running():
                     steam_running = True
                     print("✓ Steam is running - will apply changes live")
-            except:
-                pass  # pgrep not available or other error, continue anyway
+            except OSError:
+                pass  # /proc not available, continue anyway
             
-            # Read the current config with proper error handling
+            # Map the current config instead of reading and decoding a copy of it
             try:
-                with open(localconfig_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    config_content = f.read()
+                with open(localconfig_path, 'rb') as f, \
+                        mmap.mmap(f.fileno(), 0, flags=_MAP_FLAGS, prot=mmap.PROT_READ) as config_map:
+                    print(f"✓ Config file mapped successfully ({len(config_map)} bytes)")
+                    
+                    # Parse VDF structure more robustly
+                    ok, changed = self._modify_vdf_launch_options(config_map, localconfig_path, app_id, launch_command)
             except PermissionError:
-                print(f"❌ Permission denied reading {localconfig_path}")
+                print(f"❌ Permission denied opening {localconfig_path}")
                 print("   Try running with sudo or change file permissions")
                 return False
-            except Exception as e:
+            except (OSError, ValueError) as e:
                 print(f"❌ Error reading config file: {e}")
                 return False
             
-            print(f"✓ Config file read successfully ({len(config_content)} characters)")
-            
-            # Parse VDF structure more robustly
-            success = self._modify_vdf_launch_options(config_content, localconfig_path, app_id, launch_command)
+            if not ok:
+                print("❌ Failed to apply launch options")
+                return False
             
-            if success:
+            if changed:
                 print("✅ Launch options applied successfully!")
                 
                 # If Steam is running, signal it to reload the config
@@ -2113,76 +2555,58 @@ flow_scale = 1.0
                     print("   Launch options are now active - no restart needed!")
                 else:
                     print("   Launch options will be active when Steam starts")
-                
-                return True
-            else:
-                print("❌ Failed to apply launch options")
-                return False
+            
+            return True
             
         except Exception as e:
             print(f"Error applying launch options: {e}")
             return False
     
-    def _modify_vdf_launch_options(self, config_content: str, config_path: Path, app_id: str, launch_command: str) -> bool:
-        """Modify VDF file with proper Steam VDF syntax and positioning"""
+    def _modify_vdf_launch_options(self, config_content: bytes, config_path: Path, app_id: str, launch_command: str) -> Tuple[bool, bool]:
+        """Modify VDF file with proper Steam VDF syntax and positioning
+
+        config_content is the raw file content of config_path, as bytes or a
+        read-only mmap; it is never decoded. An edit that keeps the app section
+        length is written in place with pwrite instead of rewriting the file.
+
+        Returns (ok, changed): (True, True) when the file was updated, (True, False)
+        when the app already had exactly these launch options and nothing was
+        written, and (False, False) on error.
+        """
         try:
-            import re
-            
-            # Look for the apps section first
-            apps_section_start = config_content.find('"apps"')
-            if apps_section_start == -1:
+            # Walk the VDF tokens to the app's block under Software/Valve/Steam/apps
+            apps_found, brace_start, brace_end = _find_vdf_app_block(config_content, app_id)
+            if not apps_found:
                 print("❌ apps section not found in Steam config")
-                return False
-            
-            # Search for the app ID within the apps section using more robust pattern
-            app_pattern = f'"{app_id}"'
-            app_section_start = config_content.find(app_pattern, apps_section_start)
-            if app_section_start == -1:
+                return False, False
+            if brace_start == -1:
                 print(f"❌ Game with App ID {app_id} not found in Steam config")
                 print("   Make sure the game is in your Steam library and has been launched at least once")
-                return False
+                return False, False
             
             print(f"✓ Found game with App ID {app_id} in apps section")
             
-            # Find the opening brace after the app ID (proper VDF parsing)
-            brace_start = config_content.find('{', app_section_start)
-            if brace_start == -1:
-                print("Could not find opening brace for app section")
-                return False
-            
-            # Find the matching closing brace by counting braces (proper VDF parsing)
-            brace_count = 0
-            brace_end = -1
-            for i in range(brace_start, len(config_content)):
-                if config_content[i] == '{':
-                    brace_count += 1
-                elif config_content[i] == '}':
-                    brace_count -= 1
-                    if brace_count == 0:
-                        brace_end = i
-                        break
-            
-            if brace_end == -1:
-                print("Could not find closing brace for app section")
-                return False
-            
             # Extract the app section content (between braces)
             app_section_start_pos = brace_start + 1
             app_section_content = config_content[app_section_start_pos:brace_end]
             
             # Check if LaunchOptions already exists with proper VDF regex
-            launch_options_pattern = r'"LaunchOptions"\s+("([^"\\]|\\.)*")'
-            
-            match = re.search(launch_options_pattern, app_section_content)
+            match = _LAUNCH_OPTS_RE.search(app_section_content)
             
             # Escape quotes in the launch command for VDF format (like Steam does)
-            escaped_command = launch_command.replace('\\', '\\\\').replace('"', '\\"')
+            escaped_command = launch_command.replace('\\', '\\\\').replace('"', '\\"').encode('utf-8')
+            
+            # Nothing to do if the game already has exactly these options
+            if match and match.group(1) == escaped_command:
+                print("✓ Launch options already set - no changes needed")
+                return True, False
             
             if match:
                 # Replace existing launch options (preserving exact Steam VDF format)
-                old_options = match.group(2) if match.group(2) else ""
-                new_launch_line = f'"LaunchOptions"\t\t"{escaped_command}"'
-                new_app_content = re.sub(launch_options_pattern, new_launch_line, app_section_content)
+                old_options = match.group(1).decode('utf-8', errors='replace')
+                new_launch_line = b'"LaunchOptions"\t\t"' + escaped_command + b'"'
+                new_app_content = (app_section_content[:match.start()] + new_launch_line
+                                   + app_section_content[match.end():])
                 print(f"✓ Replaced existing launch options")
                 print(f"   Old: '{old_options}'")
                 print(f"   New: '{launch_command}'")
@@ -2192,67 +2616,98 @@ flow_scale = 1.0
                 # Find a good insertion point after any existing high-priority keys
                 
                 # Look for common Steam app keys to insert after
-                insertion_keys = ['"name"', '"LastUpdated"', '"SizeOnDisk"', '"tool"']
+                insertion_keys = [b'"name"', b'"LastUpdated"', b'"SizeOnDisk"', b'"tool"']
                 insertion_pos = 0
                 
                 for key in insertion_keys:
                     key_pos = app_section_content.find(key)
                     if key_pos != -1:
                         # Find the end of this key-value pair
-                        line_end = app_section_content.find('\n', key_pos)
+                        line_end = app_section_content.find(b'\n', key_pos)
                         if line_end != -1:
                             insertion_pos = line_end + 1
                 
                 # Use exact Steam VDF indentation
-                indent = '\t\t\t\t\t\t'  # Steam uses exactly 6 tabs for app properties
+                indent = b'\t\t\t\t\t\t'  # Steam uses exactly 6 tabs for app properties
                 
                 # Insert the launch options at the determined position
-                new_launch_line = f'{indent}"LaunchOptions"\t\t"{escaped_command}"\n'
+                new_launch_line = indent + b'"LaunchOptions"\t\t"' + escaped_command + b'"\n'
                 new_app_content = app_section_content[:insertion_pos] + new_launch_line + app_section_content[insertion_pos:]
                 print(f"✓ Added new launch options: '{launch_command}'")
             
-            # Replace the app section content in the full config
-            new_config = config_content[:app_section_start_pos] + new_app_content + config_content[brace_end:]
+            # Verify the edit in memory, before anything touches the disk
+            if escaped_command not in new_app_content:
+                print("⚠️ Warning: Could not verify launch options in updated config")
+                return False, False
+            
+            # Same size: the section is patched in place, otherwise the file is replaced
+            in_place = len(new_app_content) == len(app_section_content)
             
             # Create backup with timestamp (like Steam does)
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = config_path.with_suffix(f'.vdf.backup_{timestamp}')
             try:
-                shutil.copy2(config_path, backup_path)
+                if in_place:
+                    _backup_copy(config_path, backup_path)
+                else:
+                    # The rewrite gets a new inode, so a hard link keeps the old data
+                    try:
+                        os.link(config_path, backup_path)
+                    except OSError:
+                        _backup_copy(config_path, backup_path)
                 print(f"✓ Backed up original config to: {backup_path}")
             except Exception as e:
                 print(f"⚠️ Warning: Could not create backup: {e}")
             
-            # Write the new config atomically (like Steam does)
             temp_path = config_path.with_suffix('.vdf.tmp')
             try:
-                with open(temp_path, 'w', encoding='utf-8') as f:
-                    f.write(new_config)
-                
-                # Atomic move (like Steam does)
-                import os
-                os.replace(temp_path, config_path)
+                if in_place:
+                    fd = os.open(config_path, os.O_WRONLY)
+                    try:
+                        offset = app_section_start_pos
+                        view = memoryview(new_app_content)
+                        while view:
+                            written = os.pwrite(fd, view, offset)
+                            view = view[written:]
+                            offset += written
+                    finally:
+                        os.close(fd)
+                else:
+                    # Write the new config atomically (like Steam does)
+                    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                    try:
+                        if isinstance(config_content, mmap.mmap):
+                            # Unchanged head and tail are copied kernel-side from the original file
+                            src_fd = os.open(config_path, os.O_RDONLY)
+                            try:
+                                _copy_range(src_fd, fd, 0, app_section_start_pos, config_content)
+                                _write_all(fd, new_app_content)
+                                _copy_range(src_fd, fd, brace_end,
+                                            len(config_content) - brace_end, config_content)
+                            finally:
+                                os.close(src_fd)
+                        else:
+                            # Replace the app section content in the full config
+                            _write_all(fd, config_content[:app_section_start_pos] + new_app_content
+                                       + config_content[brace_end:])
+                        # No fsync: Steam rewrites this file itself, durability isn't worth the stall
+                    finally:
+                        os.close(fd)
+                    
+                    # Atomic move (like Steam does)
+                    os.replace(temp_path, config_path)
                 
                 print("✅ Steam configuration updated successfully!")
-                
-                # Verify the changes were written correctly
-                with open(config_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    verification_content = f.read()
-                
-                if f'"{app_id}"' in verification_content and escaped_command in verification_content:
-                    print("✅ Verification: Launch options successfully written to config")
-                    return True
-                else:
-                    print("⚠️ Warning: Could not verify launch options in updated config")
-                    return False
+                print("✅ Verification: Launch options successfully written to config")
+                return True, True
                 
             except PermissionError:
                 print(f"❌ Permission denied writing to {config_path}")
                 print("   Try running with sudo or change file permissions")
-                return False
+                return False, False
             except Exception as e:
                 print(f"❌ Error writing config file: {e}")
-                return False
+                return False, False
             finally:
                 # Clean up temp file if it exists
                 if temp_path.exists():
@@ -2263,42 +2718,34 @@ flow_scale = 1.0
                         
         except Exception as e:
             print(f"❌ Error modifying VDF file: {e}")
-            return False
+            return False, False
     
     def _signal_steam_config_reload(self):
         """Signal Steam to reload configuration (like Valve does internally)"""
         try:
             # Method 1: Touch the config file to update mtime (Steam watches this)
-            import os
-            import time
-            
             # Update the file's modification time
             current_time = time.time()
             
             # Find the config file path
             userdata_path = self.steam_path / "userdata"
-            user_dirs = [d for d in userdata_path.iterdir() if d.is_dir() and d.name.isdigit()]
+            newest_user_dir, _ = _newest_user_dir(userdata_path)
             
-            if user_dirs:
-                user_dir = max(user_dirs, key=lambda x: x.stat().st_mtime)
-                config_path = user_dir / "config" / "localconfig.vdf"
+            if newest_user_dir:
+                config_path = Path(newest_user_dir) / "config" / "localconfig.vdf"
                 
                 if config_path.exists():
                     os.utime(config_path, (current_time, current_time))
             
             # Method 2: Send SIGHUP to Steam process (if supported)
             try:
-                result = subprocess.run(['pgrep', '-f', 'steam'], capture_output=True, text=True)
-                if result.returncode == 0:
-                    pids = result.stdout.strip().split('\n')
-                    for pid in pids:
-                        if pid.strip():
-                            try:
-                                # Send SIGHUP to request config reload
-                                subprocess.run(['kill', '-HUP', pid.strip()], check=False)
-                            except:
-                                pass
-            except:
+                for pid in _find_steam_pids():
+                    try:
+                        # Send SIGHUP to request config reload
+                        os.kill(pid, signal.SIGHUP)
+                    except OSError:
+                        pass
+            except OSError:
                 pass
                 
         except Exception as e:
@@ -2308,46 +2755,53 @@ flow_scale = 1.0
     def restart_steam(self):
         try:
             print("🔄 Stopping Steam...")
-            # More thorough Steam stopping
-            subprocess.run(["pkill", "-f", "steam"], check=False)
-            subprocess.run(["pkill", "-f", "Steam"], check=False)
-            subprocess.run(["killall", "steam"], check=False, stderr=subprocess.DEVNULL)
-            subprocess.run(["killall", "Steam"], check=False, stderr=subprocess.DEVNULL)
-            
-            # Wait for Steam to fully close
-            import time
-            print("⏳ Waiting for Steam to close completely...")
-            time.sleep(5)
-            
-            # Verify Steam is closed
-            result = subprocess.run(['pgrep', '-f', 'steam'], capture_output=True, text=True)
-            if result.returncode == 0:
-                print("⚠️  Steam processes still running. Waiting longer...")
-                time.sleep(3)
+            try:
+                # Signal Steam directly and wait on its pidfds, returning as soon as it exits
+                steam_pids = _find_steam_pids()
+                for pid in steam_pids:
+                    try:
+                        os.kill(pid, signal.SIGTERM)
+                    except ProcessLookupError:
+                        pass
+                
+                print("⏳ Waiting for Steam to close completely...")
+                survivors = _wait_for_exit(steam_pids, timeout=5)
+                if survivors:
+                    print("⚠️  Steam processes still running. Waiting longer...")
+                    survivors = _wait_for_exit(survivors, timeout=3)
+                if survivors:
+                    # Grace period over: force the remaining processes down
+                    print(f"⚠️  Force-stopping {len(survivors)} Steam process(es)...")
+                    for pid in survivors:
+                        try:
+                            os.kill(pid, signal.SIGKILL)
+                        except ProcessLookupError:
+                            pass
+                    _wait_for_exit(survivors, timeout=2)
+            except OSError:
+                # No /proc or pidfd support: fall back to pkill (-i covers "steam" and "Steam")
+                subprocess.run(["pkill", "-i", "-f", "steam"], check=False)
+                
+                # Poll for Steam to fully close instead of sleeping a fixed time
+                print("⏳ Waiting for Steam to close completely...")
+                deadline = time.monotonic() + 8
+                while time.monotonic() < deadline:
+                    result = subprocess.run(["pgrep", "-i", "-f", "steam"], stdout=subprocess.DEVNULL)
+                    if result.returncode != 0:
+                        break
+                    time.sleep(0.25)
+                else:
+                    print("⚠️  Steam processes still running")
             
             print("🚀 Starting Steam...")
-            # Try multiple ways to start Steam
-            start_commands = [
-                ["steam"],
-                ["/usr/bin/steam"],
-                ["flatpak", "run", "com.valvesoftware.Steam"],
-                ["snap", "run", "steam"]
-            ]
-            
-            steam_started = False
-            for cmd in start_commands:
-                try:
-                    subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                    steam_started = True
-                    print(f"✅ Steam started using: {' '.join(cmd)}")
-                    break
-                except FileNotFoundError:
-                    continue
-            
-            if not steam_started:
+            # Use the first of the known ways to start Steam that is installed
+            cmd = self._steam_launcher
+            if not cmd:
                 print("❌ Could not start Steam automatically")
                 print("Please manually start Steam from your applications menu")
             else:
+                _spawn(cmd, quiet=True)
+                print(f"✅ Steam started using: {' '.join(cmd)}")
                 print("✅ Steam is restarting...")
                 print("   Please wait for Steam to fully load, then check your game's launch options")
             
@@ -2355,7 +2809,219 @@ flow_scale = 1.0
             print(f"❌ Error restarting Steam: {e}")
             print("Please manually restart Steam to apply launch options.")
 
-def main():
+def _ask(prompt: str) -> str:
+    """Prompt for a menu choice and return it stripped.
+
+    Reads stdin directly instead of going through input(). Like input(),
+    raises EOFError when stdin is closed. The answer is interned so that
+    comparisons against the choice literals are identity hits.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return sys.intern(line.strip())
+
+# Install locations listed per page before asking whether to show more
+_LOCATIONS_PAGE_SIZE = 20
+
+def _handle_install(manager: OptiScalerManager) -> None:
+    # Streamlined install process
+    print("\n=== Install OptiScaler ===")
+    
+    # Auto-download latest nightly
+    print("Downloading latest OptiScaler nightly...")
+    zip_path = manager.download_latest_nightly()
+    if not zip_path:
+        print("Failed to download OptiScaler. Please check internet connection.")
+        return
+        
+    # List games for selection
+    games = manager.get_steam_games()
+    if not games:
+        print("No Steam games found")
+        return
+        
+    print("\nSelect a game to install OptiScaler:")
+    print("\n".join(f"{i}. {game['name']}" for i, game in enumerate(games, 1)))
+    
+    # Scan for FSR4 DLL versions while the user picks a game; the result lands in the versions cache.
+    # A daemon thread, so quitting mid-scan doesn't wait for the walk to finish
+    fsr4_prefetch = threading.Thread(target=manager.find_available_fsr4_versions, daemon=True)
+    fsr4_prefetch.start()
+    
+    try:
+        game_idx = int(input("Game number: ")) - 1
+        selected_game = games[game_idx]
+        
+        print(f"\nAnalyzing game directory: {selected_game['name']}")
+        print("Searching for executable locations...")
+        
+        exe_locations = manager.find_game_executable_paths(selected_game["path"])
+        if not exe_locations:
+            print("No suitable executable locations found")
+            print("This game may not be compatible or may have an unusual directory structure")
+            return
+        
+        print(f"\nFound {len(exe_locations)} possible installation location(s):")
+        print("=" * 80)
+        
+        # Best matches come first, so show a page at a time and only go on when asked
+        for start in range(0, len(exe_locations), _LOCATIONS_PAGE_SIZE):
+            if start and input(f"Show more locations ({len(exe_locations) - start} left)? (y/n): ").lower() != 'y':
+                break
+            for i, location in enumerate(exe_locations[start:start + _LOCATIONS_PAGE_SIZE], start + 1):
+                print(f"{i}. {location['type']}")
+                print(f"   Executable: {location['exe_name']}")
+                print(f"   Path: {location['relative_path'] if location['relative_path'] != '.' else 'Game Root Directory'}")
+                print(f"   Full Path: {location['path']}")
+                print()
+        
+        print("Choose the installation location:")
+        print("- Main Game Directory is usually the best choice")
+        print("- Shipping Executable locations work well for UE games")
+        print("- Choose based on where the main game .exe file is located")
+        
+        path_idx = int(input(f"\nInstallation location (1-{len(exe_locations)}): ")) - 1
+        selected_location = exe_locations[path_idx]
+        
+        print(f"\nSelected: {selected_location['type']}")
+        print(f"Installing to: {selected_location['path']}")
+        
+        fsr4_prefetch.join()
+        if manager.install_optiscaler(selected_game, selected_location, zip_path):
+            print("\n✓ OptiScaler installed successfully!")
+            
+            # Auto FSR4 setup
+            print("\nSetting up FSR4 DLL...")
+            if not manager.fsr4_dll_path or not manager.fsr4_dll_path.exists():
+                print("FSR4 DLL not found. Attempting to locate...")
+                manager.select_fsr4_version()
+            
+            # Auto apply launch options
+            print("\nConfiguring Steam launch options...")
+            rdna3 = input("RDNA3 GPU workaround needed? (y/n): ").lower() == 'y'
+            manager.add_steam_launch_options(selected_game["app_id"], rdna3, auto_apply=True)
+            
+            print("\n🎉 Installation complete!")
+            print("✓ OptiScaler installed")
+            print("✓ FSR4 DLL configured")
+            print("✓ Steam launch options applied")
+            print("\nReady to play! Launch the game and press INSERT for OptiScaler overlay")
+            print("\n💡 Proton Version Recommendation:")
+            print("   For best compatibility, consider using a custom Proton version:")
+            print("   • ProtonPlus (recommended)")
+            print("   • CachyOS Proton")
+            print("   • EM Proton")
+            print("   • Bleeding Edge Proton Experimental")
+            print("   Configure in Steam > Properties > Compatibility > Force specific Steam Play tool")
+        else:
+            print("✗ Installation failed")
+            
+    except (ValueError, IndexError):
+        print("Invalid selection")
+
+def _handle_lsfg(manager: OptiScalerManager) -> None:
+    # Install LSFG-VK
+    print("\n=== Install LSFG-VK ===")
+    manager.install_lsfg_vk()
+
+def _handle_manage(manager: OptiScalerManager) -> None:
+    # Manage installed games
+    print("\n=== Manage Installed Games ===")
+    installs = manager.load_installations()
+    if not installs:
+        print("No OptiScaler installations found")
+        return
+        
+    print("\nCurrent OptiScaler Installations:")
+    print("=" * 60)
+    for i, install in enumerate(installs, 1):
+        print(f"{i}. {install['game']['name']}")
+        print(f"   Installed: {install['timestamp']}")
+        print(f"   Path: {install['install_path']}")
+        
+        # Show exe location details if available
+        if 'exe_location' in install:
+            exe_loc = install['exe_location']
+            print(f"   Type: {exe_loc['type']}")
+            print(f"   Executable: {exe_loc['exe_name']}")
+        
+        # Show FSR4 status
+        fsr4_status = "✓ FSR4 DLL copied" if install.get('fsr4_dll_copied', False) else "✗ FSR4 DLL not copied"
+        print(f"   FSR4: {fsr4_status}")
+        print()
+    
+    sys.stdout.write(_MANAGE_MENU)
+    sys.stdout.flush()
+    
+    action = _ask("\nSelect action (1-3): ")
+    
+    if action == "1":
+        # Uninstall functionality
+        try:
+            install_idx = int(input(f"Installation to uninstall (1-{len(installs)}): ")) - 1
+            selected_install = installs[install_idx]
+            
+            print(f"\nUninstalling OptiScaler from: {selected_install['game']['name']}")
+            print(f"Directory: {selected_install['install_path']}")
+            
+            confirmation = input("Are you sure you want to uninstall? (y/n): ").lower()
+            if confirmation != 'y':
+                print("Uninstall cancelled")
+                return
+            
+            if manager.uninstall_optiscaler(selected_install):
+                manager.remove_installation(install_idx)
+                print("✓ OptiScaler uninstalled successfully!")
+            else:
+                print("✗ Uninstallation failed")
+                
+        except (ValueError, IndexError):
+            print("Invalid selection")
+    
+    elif action == "2":
+        # View launch options
+        try:
+            install_idx = int(input(f"Game to view launch options (1-{len(installs)}): ")) - 1
+            selected_install = installs[install_idx]
+            game = selected_install['game']
+            
+            print(f"\nLaunch options for: {game['name']} (App ID: {game['app_id']})")
+            rdna3 = input("RDNA3 GPU workaround needed? (y/n): ").lower() == 'y'
+            manager.add_steam_launch_options(game["app_id"], rdna3, auto_apply=False)
+            
+        except (ValueError, IndexError):
+            print("Invalid selection")
+    
+    elif action == "3":
+        return
+
+# Main menu choice -> handler; "4" exits the loop
+_DISPATCH = {
+    "1": _handle_install,
+    "2": _handle_lsfg,
+    "3": _handle_manage,
+}
+
+# Menus are static, so each redraw is a single write
+_MAIN_MENU = (
+    "\n=== OptiScaler Manager ===\n"
+    "1. Install OptiScaler\n"
+    "2. Install LSFG-VK (Lossless Scaling Frame Generation)\n"
+    "3. Manage installed games\n"
+    "4. Exit\n"
+)
+
+_MANAGE_MENU = (
+    "Actions:\n"
+    "1. Uninstall a game\n"
+    "2. View launch options for a game\n"
+    "3. Back to main menu\n"
+)
+
+def _interactive() -> None:
     print("=" * 60)
     print("🚀 OptiScaler Manager - Enhanced Version")
     print("=" * 60)
@@ -2367,16 +3033,8 @@ def main():
         sys.exit(1)
     
     # Quick check for common tools
-    missing_tools = []
     tools_to_check = ['7z', 'git', 'wine']
-    
-    for tool in tools_to_check:
-        try:
-            result = subprocess.run(['which', tool], capture_output=True, text=True)
-            if result.returncode != 0:
-                missing_tools.append(tool)
-        except Exception:
-            missing_tools.append(tool)
+    missing_tools = [tool for tool in tools_to_check if not shutil.which(tool)]
     
     if missing_tools:
         print(f"⚠️ Optional tools not found: {', '.join(missing_tools)}")
@@ -2395,186 +3053,139 @@ def main():
     manager = OptiScalerManager()
     
     while True:
-        print("\n=== OptiScaler Manager ===")
-        print("1. Install OptiScaler")
-        print("2. Install LSFG-VK (Lossless Scaling Frame Generation)")
-        print("3. Manage installed games")
-        print("4. Exit")
+        sys.stdout.write(_MAIN_MENU)
+        sys.stdout.flush()
         
-        choice = input("\nEnter choice (1-4): ").strip()
-        
-        if choice == "1":
-            # Streamlined install process
-            print("\n=== Install OptiScaler ===")
-            
-            # Auto-download latest nightly
-            print("Downloading latest OptiScaler nightly...")
-            zip_path = manager.download_latest_nightly()
-            if not zip_path:
-                print("Failed to download OptiScaler. Please check internet connection.")
-                continue
-                
-            # List games for selection
-            games = manager.get_steam_games()
-            if not games:
-                print("No Steam games found")
-                continue
-                
-            print("\nSelect a game to install OptiScaler:")
-            for i, game in enumerate(games, 1):
-                print(f"{i}. {game['name']}")
-            
-            try:
-                game_idx = int(input("Game number: ")) - 1
-                selected_game = games[game_idx]
-                
-                print(f"\nAnalyzing game directory: {selected_game['name']}")
-                print("Searching for executable locations...")
-                
-                exe_locations = manager.find_game_executable_paths(selected_game["path"])
-                if not exe_locations:
-                    print("No suitable executable locations found")
-                    print("This game may not be compatible or may have an unusual directory structure")
-                    continue
-                
-                print(f"\nFound {len(exe_locations)} possible installation location(s):")
-                print("=" * 80)
-                
-                for i, location in enumerate(exe_locations, 1):
-                    print(f"{i}. {location['type']}")
-                    print(f"   Executable: {location['exe_name']}")
-                    print(f"   Path: {location['relative_path'] if location['relative_path'] != '.' else 'Game Root Directory'}")
-                    print(f"   Full Path: {location['path']}")
-                    print()
-                
-                print("Choose the installation location:")
-                print("- Main Game Directory is usually the best choice")
-                print("- Shipping Executable locations work well for UE games")
-                print("- Choose based on where the main game .exe file is located")
-                
-                path_idx = int(input(f"\nInstallation location (1-{len(exe_locations)}): ")) - 1
-                selected_location = exe_locations[path_idx]
-                
-                print(f"\nSelected: {selected_location['type']}")
-                print(f"Installing to: {selected_location['path']}")
-                
-                if manager.install_optiscaler(selected_game, selected_location, zip_path):
-                    print("\n✓ OptiScaler installed successfully!")
-                    
-                    # Auto FSR4 setup
-                    print("\nSetting up FSR4 DLL...")
-                    if not manager.fsr4_dll_path or not manager.fsr4_dll_path.exists():
-                        print("FSR4 DLL not found. Attempting to locate...")
-                        manager.select_fsr4_version()
-                    
-                    # Auto apply launch options
-                    print("\nConfiguring Steam launch options...")
-                    rdna3 = input("RDNA3 GPU workaround needed? (y/n): ").lower() == 'y'
-                    manager.add_steam_launch_options(selected_game["app_id"], rdna3, auto_apply=True)
-                    
-                    print("\n🎉 Installation complete!")
-                    print("✓ OptiScaler installed")
-                    print("✓ FSR4 DLL configured")
-                    print("✓ Steam launch options applied")
-                    print("\nReady to play! Launch the game and press INSERT for OptiScaler overlay")
-                    print("\n💡 Proton Version Recommendation:")
-                    print("   For best compatibility, consider using a custom Proton version:")
-                    print("   • ProtonPlus (recommended)")
-                    print("   • CachyOS Proton")
-                    print("   • EM Proton")
-                    print("   • Bleeding Edge Proton Experimental")
-                    print("   Configure in Steam > Properties > Compatibility > Force specific Steam Play tool")
-                else:
-                    print("✗ Installation failed")
-                    
-            except (ValueError, IndexError):
-                print("Invalid selection")
-        
-        elif choice == "2":
-            # Install LSFG-VK
-            print("\n=== Install LSFG-VK ===")
-            manager.install_lsfg_vk()
-            
-        elif choice == "3":
-            # Manage installed games
-            print("\n=== Manage Installed Games ===")
-            installs = manager.load_installations()
-            if not installs:
-                print("No OptiScaler installations found")
-                continue
-                
-            print("\nCurrent OptiScaler Installations:")
-            print("=" * 60)
-            for i, install in enumerate(installs, 1):
-                print(f"{i}. {install['game']['name']}")
-                print(f"   Installed: {install['timestamp']}")
-                print(f"   Path: {install['install_path']}")
-                
-                # Show exe location details if available
-                if 'exe_location' in install:
-                    exe_loc = install['exe_location']
-                    print(f"   Type: {exe_loc['type']}")
-                    print(f"   Executable: {exe_loc['exe_name']}")
-                
-                # Show FSR4 status
-                fsr4_status = "✓ FSR4 DLL copied" if install.get('fsr4_dll_copied', False) else "✗ FSR4 DLL not copied"
-                print(f"   FSR4: {fsr4_status}")
-                print()
-            
-            print("Actions:")
-            print("1. Uninstall a game")
-            print("2. View launch options for a game")
-            print("3. Back to main menu")
-            
-            action = input("\nSelect action (1-3): ").strip()
-            
-            if action == "1":
-                # Uninstall functionality
-                try:
-                    install_idx = int(input(f"Installation to uninstall (1-{len(installs)}): ")) - 1
-                    selected_install = installs[install_idx]
-                    
-                    print(f"\nUninstalling OptiScaler from: {selected_install['game']['name']}")
-                    print(f"Directory: {selected_install['install_path']}")
-                    
-                    confirmation = input("Are you sure you want to uninstall? (y/n): ").lower()
-                    if confirmation != 'y':
-                        print("Uninstall cancelled")
-                        continue
-                    
-                    if manager.uninstall_optiscaler(selected_install):
-                        installs.pop(install_idx)
-                        with open(manager.installs_file, 'w') as f:
-                            json.dump(installs, f, indent=2)
-                        print("✓ OptiScaler uninstalled successfully!")
-                    else:
-                        print("✗ Uninstallation failed")
-                        
-                except (ValueError, IndexError):
-                    print("Invalid selection")
-            
-            elif action == "2":
-                # View launch options
-                try:
-                    install_idx = int(input(f"Game to view launch options (1-{len(installs)}): ")) - 1
-                    selected_install = installs[install_idx]
-                    game = selected_install['game']
-                    
-                    print(f"\nLaunch options for: {game['name']} (App ID: {game['app_id']})")
-                    rdna3 = input("RDNA3 GPU workaround needed? (y/n): ").lower() == 'y'
-                    manager.add_steam_launch_options(game["app_id"], rdna3, auto_apply=False)
-                    
-                except (ValueError, IndexError):
-                    print("Invalid selection")
-            
-            elif action == "3":
-                continue
+        choice = _ask("\nEnter choice (1-4): ")
         
+        handler = _DISPATCH.get(choice)
+        if handler is not None:
+            handler(manager)
         elif choice == "4":
             break
-        
         else:
             print("Invalid choice. Please enter 1, 2, 3, or 4.")
 
+def _launch_preset(manager: OptiScalerManager, preset: str, rdna3: bool) -> Optional[str]:
+    """Command for a catalog key, or None (with the valid keys printed) if unknown."""
+    catalog = manager.get_launch_options_catalog(rdna3, include_mangohud=True)
+    key = f"{preset}_rdna3" if rdna3 and f"{preset}_rdna3" in catalog else preset
+    if key not in catalog:
+        presets = sorted(manager.get_launch_options_catalog(False, True))
+        print(f"❌ Unknown preset '{preset}'. Available presets: {', '.join(presets)}")
+        return None
+    return catalog[key]["command"]
+
+def _cli_list(manager: OptiScalerManager, args) -> bool:
+    games = manager.get_steam_games()
+    if not games:
+        print("No Steam games found")
+        return False
+    print("\n".join(f"{game['app_id']:>10}  {game['name']}" for game in games))
+    return True
+
+def _cli_download(manager: OptiScalerManager, args) -> bool:
+    zip_path = manager.download_latest_nightly()
+    if zip_path:
+        print(zip_path)
+    return bool(zip_path)
+
+def _cli_install(manager: OptiScalerManager, args) -> bool:
+    launch_command = _launch_preset(manager, args.preset, args.rdna3)
+    if launch_command is None:
+        return False
+    
+    game = next((g for g in manager.get_steam_games() if g["app_id"] == args.app_id), None)
+    if game is None:
+        print(f"❌ No installed Steam game with App ID {args.app_id}")
+        return False
+    
+    exe_locations = manager.find_game_executable_paths(game["path"])
+    if not 1 <= args.location <= len(exe_locations):
+        print(f"❌ Location {args.location} not available; {len(exe_locations)} found for {game['name']}")
+        return False
+    
+    zip_path = manager.download_latest_nightly()
+    if not zip_path:
+        print("Failed to download OptiScaler. Please check internet connection.")
+        return False
+    
+    if not manager.install_optiscaler(game, exe_locations[args.location - 1], zip_path,
+                                      run_setup=not args.no_setup):
+        print("✗ Installation failed")
+        return False
+    print("\n✓ OptiScaler installed successfully!")
+    return manager.apply_steam_launch_options(game["app_id"], launch_command)
+
+def _cli_uninstall(manager: OptiScalerManager, args) -> bool:
+    installs = manager.load_installations()
+    install_idx = next((i for i, install in enumerate(installs)
+                        if install["game"]["app_id"] == args.app_id), None)
+    if install_idx is None:
+        print(f"❌ No OptiScaler installation recorded for App ID {args.app_id}")
+        return False
+    
+    if not manager.uninstall_optiscaler(installs[install_idx]):
+        print("✗ Uninstallation failed")
+        return False
+    manager.remove_installation(install_idx)
+    print("✓ OptiScaler uninstalled successfully!")
+    return True
+
+def _cli_apply_launch_options(manager: OptiScalerManager, args) -> bool:
+    launch_command = _launch_preset(manager, args.preset, args.rdna3)
+    if launch_command is None:
+        return False
+    # Keep going after a failure so one bad App ID doesn't stop the batch
+    results = [manager.apply_steam_launch_options(app_id, launch_command) for app_id in args.app_ids]
+    return all(results)
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Install OptiScaler into Steam games and manage their launch options. "
+                    "Runs the interactive menu when no command is given.")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+    
+    commands.add_parser("interactive", help="menu-driven mode (default)")
+    commands.add_parser("list", help="list installed Steam games with their App IDs").set_defaults(func=_cli_list)
+    commands.add_parser("download", help="download the latest OptiScaler build").set_defaults(func=_cli_download)
+    
+    install = commands.add_parser("install", help="install OptiScaler into a game and apply launch options")
+    install.add_argument("app_id", help="Steam App ID of the game")
+    install.add_argument("--location", type=int, default=1,
+                         help="executable location to install to, as numbered by the menu (default: 1)")
+    install.add_argument("--preset", default="basic", help="launch options preset (default: basic)")
+    install.add_argument("--rdna3", action="store_true", help="use the RDNA3 workaround variant of the preset")
+    install.add_argument("--no-setup", action="store_true",
+                         help="skip the setup script and FSR4 version prompt, for unattended installs")
+    install.set_defaults(func=_cli_install)
+    
+    uninstall = commands.add_parser("uninstall", help="remove OptiScaler from a game")
+    uninstall.add_argument("app_id", help="Steam App ID of the game")
+    uninstall.set_defaults(func=_cli_uninstall)
+    
+    apply = commands.add_parser("apply-launch-options", help="write a launch options preset for one or more games")
+    apply.add_argument("app_ids", nargs="+", metavar="app_id", help="Steam App ID(s)")
+    apply.add_argument("--preset", default="basic", help="launch options preset, e.g. basic, advanced, debug, antilag")
+    apply.add_argument("--rdna3", action="store_true", help="use the RDNA3 workaround variant of the preset")
+    apply.set_defaults(func=_cli_apply_launch_options)
+    
+    return parser
+
+def main(argv: Optional[List[str]] = None):
+    args = _build_parser().parse_args(argv)
+    if args.command in (None, "interactive"):
+        _interactive()
+        return
+    try:
+        ok = args.func(OptiScalerManager(), args)
+    except EOFError:
+        # A prompt hit the end of stdin (piped or CI run)
+        print(f"\n❌ '{args.command}' needs an interactive terminal to answer its prompts")
+        if args.command == "install":
+            print("   Use --no-setup to install without the setup script and FSR4 prompt")
+        sys.exit(1)
+    sys.exit(0 if ok else 1)
+
 if __name__ == "__main__":
     main()
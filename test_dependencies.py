@@ -4,52 +4,49 @@ Test script for dependency management functionality
 """
 
 import sys
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from optiscaler_manager import DependencyManager
 
-def test_system_detection():
+def test_system_detection(log=print):
     """Test system detection capabilities."""
-    print("🔍 Testing system detection...")
+    log("🔍 Testing system detection...")
     
     dep_manager = DependencyManager()
     
     # Test package manager detection
     pm = dep_manager.detect_package_manager()
-    print(f"Package manager detected: {pm}")
+    log(f"Package manager detected: {pm}")
     
     # Test distro detection
     distro = dep_manager.detect_distro()
-    print(f"Distribution detected: {distro}")
+    log(f"Distribution detected: {distro}")
     
     # Test display server detection
     wayland = dep_manager.is_wayland()
-    print(f"Wayland display server: {wayland}")
+    log(f"Wayland display server: {wayland}")
     
     return pm is not None
 
-def test_clipboard_detection():
+def test_clipboard_detection(log=print):
     """Test clipboard app detection."""
-    print("\n📋 Testing clipboard detection...")
+    log("\n📋 Testing clipboard detection...")
     
     dep_manager = DependencyManager()
     
     installed_apps = []
     for app_name in dep_manager.clipboard_apps.keys():
-        try:
-            import subprocess
-            result = subprocess.run(['which', app_name], capture_output=True, text=True)
-            if result.returncode == 0:
-                installed_apps.append(app_name)
-                print(f"✅ {app_name} found")
-            else:
-                print(f"❌ {app_name} not found")
-        except Exception:
-            print(f"❌ {app_name} not found")
+        if shutil.which(app_name):
+            installed_apps.append(app_name)
+            log(f"✅ {app_name} found")
+        else:
+            log(f"❌ {app_name} not found")
     
     return len(installed_apps) > 0
 
-def test_tool_detection():
+def test_tool_detection(log=print):
     """Test system tool detection."""
-    print("\n🔧 Testing system tool detection...")
+    log("\n🔧 Testing system tool detection...")
     
     dep_manager = DependencyManager()
     
@@ -57,31 +54,26 @@ def test_tool_detection():
     found_tools = []
     
     for tool in tools:
-        try:
-            import subprocess
-            result = subprocess.run(['which', tool], capture_output=True, text=True)
-            if result.returncode == 0:
-                found_tools.append(tool)
-                print(f"✅ {tool} found")
-            else:
-                print(f"❌ {tool} not found")
-        except Exception:
-            print(f"❌ {tool} not found")
+        if shutil.which(tool):
+            found_tools.append(tool)
+            log(f"✅ {tool} found")
+        else:
+            log(f"❌ {tool} not found")
     
     return len(found_tools) > 0
 
-def test_python_modules():
+def test_python_modules(log=print):
     """Test Python module detection."""
-    print("\n🐍 Testing Python module detection...")
+    log("\n🐍 Testing Python module detection...")
     
     dep_manager = DependencyManager()
     
     # Test requests module
     if dep_manager.check_python_module('requests'):
-        print("✅ requests module available")
+        log("✅ requests module available")
         return True
     else:
-        print("❌ requests module not available")
+        log("❌ requests module not available")
         return False
 
 def main():
@@ -90,13 +82,23 @@ def main():
     print("🧪 Dependency Management Test Suite")
     print("=" * 60)
     
-    test_results = []
+    tests = [
+        ("System Detection", test_system_detection),
+        ("Python Modules", test_python_modules),
+        ("System Tools", test_tool_detection),
+        ("Clipboard Apps", test_clipboard_detection),
+    ]
+    
+    # Run the tests side by side, each logging into its own buffer,
+    # then replay the logs in suite order so the output stays deterministic
+    logs = [[] for _ in tests]
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        futures = [executor.submit(test, log.append) for (_, test), log in zip(tests, logs)]
     
-    # Run tests
-    test_results.append(("System Detection", test_system_detection()))
-    test_results.append(("Python Modules", test_python_modules()))
-    test_results.append(("System Tools", test_tool_detection()))
-    test_results.append(("Clipboard Apps", test_clipboard_detection()))
+    test_results = []
+    for (test_name, _), future, log in zip(tests, futures, logs):
+        print("\n".join(log))
+        test_results.append((test_name, future.result()))
     
     # Print results
     print("\n" + "=" * 60)
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+
+"""
+Test script for the OptiScaler Manager's file operations
+Tests FSR4 DLL discovery and the copy/extract helpers on temporary directories
+"""
+
+import os
+import sys
+import time
+import zipfile
+from pathlib import Path
+from unittest import mock
+from tempfile import TemporaryDirectory
+
+# Add the project directory to the path
+sys.path.insert(0, str(Path(__file__).parent))
+
+import optiscaler_manager
+from optiscaler_manager import OptiScalerManager, _backup_copy, _extract_zip
+
+def test_fsr4_version_order():
+    """Versions are listed search dir by search dir, direct matches before nested ones"""
+    print("=== Testing FSR4 version order ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        documents = temp_path / "Documents" / "fsr4"
+        downloads = temp_path / "Downloads"
+        
+        nested_dll = documents / "pack" / "FSR 4.0.2" / "amdxcffx64.dll"
+        direct_dll = downloads / "v9" / "amdxcffx64.dll"
+        for dll in (nested_dll, direct_dll):
+            dll.parent.mkdir(parents=True)
+            dll.touch()
+        
+        manager = OptiScalerManager()
+        versions = manager._scan_fsr4_versions([documents, downloads])
+        
+        assert list(versions) == ["FSR 4.0.2", "v9"], f"Unexpected order: {list(versions)}"
+        assert versions["FSR 4.0.2"] == nested_dll
+        assert versions["v9"] == direct_dll
+        print("✅ Earlier search directory wins, even for a nested match")
+    
+    return True
+
+def test_backup_copy():
+    """Backups match the source and replace an existing file of the same name"""
+    print("\n=== Testing backup copies ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        src = temp_path / "localconfig.vdf"
+        dst = temp_path / "localconfig.vdf.backup"
+        src.write_bytes(b'"UserLocalConfigStore"\n{\n}\n' * 1000)
+        os.utime(src, (1_000_000, 1_000_000))
+        dst.write_bytes(b"stale")
+        
+        _backup_copy(src, dst)
+        assert dst.read_bytes() == src.read_bytes(), "Backup content differs from source"
+        assert dst.stat().st_mtime == src.stat().st_mtime, "Backup mtime not copied"
+        assert os.stat(dst).st_ino != os.stat(src).st_ino, "Backup must be a separate file"
+        print("✅ Backup copied content and metadata")
+        
+        # A refused link (no /proc, EXDEV, sandbox) must still leave a backup behind
+        dst.unlink()
+        with mock.patch.object(optiscaler_manager.os, "link", side_effect=PermissionError("link refused")):
+            _backup_copy(src, dst)
+        assert dst.read_bytes() == src.read_bytes(), "Fallback backup content differs from source"
+        print("✅ Backup falls back to a plain copy when linking fails")
+    
+    return True
+
+def test_extract_zip():
+    """Archives extract completely, and member paths cannot escape the target directory"""
+    print("\n=== Testing zip extraction ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        archive = temp_path / "OptiScaler.zip"
+        target = temp_path / "game" / "bin"
+        target.mkdir(parents=True)
+        
+        members = {f"D3D12_Optiscaler/file{i}.dll": os.urandom(1024) * (i + 1) for i in range(20)}
+        members["OptiScaler.ini"] = b"[Upscalers]\n"
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("D3D12_Optiscaler/", b"")
+            for name, data in members.items():
+                zf.writestr(name, data)
+            zf.writestr("../escaped.txt", b"outside")
+            zf.writestr("../../outside_dir/escaped.txt", b"outside")
+        
+        _extract_zip(archive, target)
+        
+        for name, data in members.items():
+            assert (target / name).read_bytes() == data, f"{name} extracted incorrectly"
+        print(f"✅ All {len(members)} members extracted")
+        
+        outside = [p for p in temp_path.rglob("*")
+                   if p != archive and p != target and target not in p.parents and p not in target.parents]
+        assert not outside, f"Extracted outside the target directory: {outside}"
+        assert (target / "escaped.txt").read_bytes() == b"outside"
+        assert (target / "outside_dir" / "escaped.txt").read_bytes() == b"outside"
+        print("✅ '..' members stay inside the target directory")
+    
+    return True
+
+def test_7z_falls_back_to_command():
+    """A .7z archive py7zr cannot handle is handed to the 7z command instead"""
+    print("\n=== Testing .7z extraction fallback ===")
+    
+    failing_py7zr = mock.Mock()
+    failing_py7zr.SevenZipFile.side_effect = RuntimeError("BCJ2 filter is not supported")
+    manager = OptiScalerManager()
+    
+    with mock.patch.object(optiscaler_manager, "py7zr", failing_py7zr), \
+            mock.patch.object(optiscaler_manager.subprocess, "run") as run:
+        run.return_value = mock.Mock(returncode=0, stderr="")
+        assert manager.extract_optiscaler("/tmp/OptiScaler.7z", "/tmp/target") is True
+        assert run.call_args[0][0][:2] == ['7z', 'x'], run.call_args
+        print("✅ py7zr failure falls through to 7z")
+        
+        run.return_value = mock.Mock(returncode=2, stderr="Unsupported method")
+        assert manager.extract_optiscaler("/tmp/OptiScaler.7z", "/tmp/target") is False
+        print("✅ Extraction fails only when 7z fails too")
+    
+    return True
+
+def test_release_cache_recovery():
+    """A corrupt releases.json is refetched without If-None-Match and replaced"""
+    print("\n=== Testing release list cache recovery ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        manager = OptiScalerManager()
+        manager.config_dir = Path(temp_dir)
+        cache_file = manager.config_dir / "releases.json"
+        etag_file = manager.config_dir / "releases.etag"
+        
+        body = b'[{"tag_name": "v1", "assets": []}]'
+        response = mock.Mock(status_code=200, content=body, headers={"ETag": '"v1"'})
+        response.json.return_value = [{"tag_name": "v1", "assets": []}]
+        manager._http = mock.Mock()
+        manager._http.get.return_value = response
+        
+        # A write cut short left half a body behind, next to a valid etag
+        cache_file.write_bytes(body[:10])
+        etag_file.write_text('"v1"')
+        
+        for age in (0, 7 * 24 * 3600):  # fresh and past the TTL
+            os.utime(cache_file, (time.time() - age,) * 2)
+            assert manager._fetch_releases() == [{"tag_name": "v1", "assets": []}]
+            headers = manager._http.get.call_args.kwargs["headers"]
+            assert "If-None-Match" not in headers, "Conditional request for a corrupt cache"
+            assert cache_file.read_bytes() == body, "Cache not rewritten"
+            cache_file.write_bytes(body[:10])
+        print("✅ Corrupt cache refetched unconditionally and rewritten")
+        
+        assert sorted(p.name for p in manager.config_dir.iterdir()) == ["releases.etag", "releases.json"]
+        print("✅ No temp files left behind")
+    
+    return True
+
+def test_unattended_install():
+    """install --no-setup never prompts, and a prompt on closed stdin exits cleanly"""
+    print("\n=== Testing unattended install ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        archive = temp_path / "OptiScaler.zip"
+        target = temp_path / "game" / "bin"
+        target.mkdir(parents=True)
+        (target / "dxgi.dll").write_bytes(b"original")
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("OptiScaler.dll", b"optiscaler")
+            zf.writestr("setup_linux.sh", b"#!/bin/sh\nread answer\n")
+        
+        manager = OptiScalerManager()
+        manager.installs_file = temp_path / "installations.json"
+        manager._installs = []
+        manager.fsr4_dll_path = None
+        game = {"app_id": "1245620", "name": "Test Game", "path": str(temp_path / "game")}
+        location = {"path": str(target), "exe_name": "game.exe", "type": "Test"}
+        
+        # Any prompt would raise; closed stdin behaves the same way
+        with mock.patch("builtins.input", side_effect=EOFError):
+            assert manager.install_optiscaler(game, location, str(archive), run_setup=False) is True
+        assert (target / "OptiScaler.dll").read_bytes() == b"optiscaler"
+        assert manager.load_installations()[-1]["fsr4_dll_copied"] is False
+        print("✅ Installed without running the setup script or asking for an FSR4 version")
+    
+    with mock.patch.object(optiscaler_manager, "_cli_list", side_effect=EOFError), \
+            mock.patch.object(optiscaler_manager, "OptiScalerManager"):
+        try:
+            optiscaler_manager.main(["list"])
+        except SystemExit as e:
+            assert e.code == 1, f"Unexpected exit code {e.code}"
+        else:
+            raise AssertionError("main() did not exit")
+    print("✅ A prompt on closed stdin exits with status 1")
+    
+    return True
+
+def main():
+    """Main test function"""
+    print("OptiScaler Manager File Operations Test Suite")
+    print("=" * 60)
+    
+    tests = [
+        test_fsr4_version_order,
+        test_backup_copy,
+        test_extract_zip,
+        test_7z_falls_back_to_command,
+        test_release_cache_recovery,
+        test_unattended_install,
+    ]
+    
+    try:
+        for test in tests:
+            if not test():
+                print(f"❌ {test.__name__} failed!")
+                return 1
+        
+        print("\n🎉 ALL TESTS PASSED! 🎉")
+        return 0
+    
+    except Exception as e:
+        print(f"❌ Test suite failed with error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,7 @@ import shutil
 # Add the project directory to the path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from optiscaler_manager import OptiScalerManager
+from optiscaler_manager import OptiScalerManager, _find_vdf_app_block
 
 def create_test_vdf_content(app_id="12345"):
     """Create a sample VDF content for testing"""
@@ -74,11 +74,11 @@ def test_vdf_modification():
         print(f"\nTest 1: Adding launch options to app {test_app_id}")
         
         # Read original content
-        with open(test_vdf_path, 'r', encoding='utf-8') as f:
+        with open(test_vdf_path, 'rb') as f:
             original_content = f.read()
         
         # Modify the VDF
-        success = manager._modify_vdf_launch_options(original_content, test_vdf_path, test_app_id, test_command)
+        success, _ = manager._modify_vdf_launch_options(original_content, test_vdf_path, test_app_id, test_command)
         
         if success:
             print("✅ Test 1 PASSED: Launch options added successfully")
@@ -102,10 +102,10 @@ def test_vdf_modification():
         test_app_id_2 = "54321"
         new_test_command = 'mangohud WINEDLLOVERRIDES="dxgi=n,b" PROTON_FSR4_UPGRADE=1 %command%'
         
-        with open(test_vdf_path, 'r', encoding='utf-8') as f:
+        with open(test_vdf_path, 'rb') as f:
             content_before_replace = f.read()
         
-        success = manager._modify_vdf_launch_options(content_before_replace, test_vdf_path, test_app_id_2, new_test_command)
+        success, _ = manager._modify_vdf_launch_options(content_before_replace, test_vdf_path, test_app_id_2, new_test_command)
         
         if success:
             print("✅ Test 2 PASSED: Existing launch options replaced successfully")
@@ -126,18 +126,17 @@ def test_vdf_modification():
         # Test 3: Test VDF syntax preservation
         print(f"\nTest 3: Checking VDF syntax preservation")
         
-        with open(test_vdf_path, 'r', encoding='utf-8') as f:
-            final_content = f.read()
+        final_data = test_vdf_path.read_bytes()
         
         # Check for proper VDF structure
         syntax_checks = [
-            ('"UserLocalConfigStore"' in final_content, "Root section preserved"),
-            ('"Software"' in final_content, "Software section preserved"),
-            ('"Valve"' in final_content, "Valve section preserved"),
-            ('"Steam"' in final_content, "Steam section preserved"),
-            ('"apps"' in final_content, "Apps section preserved"),
-            (final_content.count('{') == final_content.count('}'), "Braces balanced"),
-            ('LaunchOptions' in final_content, "LaunchOptions added"),
+            (b'"UserLocalConfigStore"' in final_data, "Root section preserved"),
+            (b'"Software"' in final_data, "Software section preserved"),
+            (b'"Valve"' in final_data, "Valve section preserved"),
+            (b'"Steam"' in final_data, "Steam section preserved"),
+            (b'"apps"' in final_data, "Apps section preserved"),
+            (final_data.count(b'{') == final_data.count(b'}'), "Braces balanced"),
+            (b'LaunchOptions' in final_data, "LaunchOptions added"),
         ]
         
         all_syntax_passed = True
@@ -159,10 +158,10 @@ def test_vdf_modification():
         
         tricky_command = 'WINEDLLOVERRIDES="dxgi=n,b;nvngx=n,b" PROTON_FSR4_UPGRADE=1 -some_arg="value with spaces" %command%'
         
-        with open(test_vdf_path, 'r', encoding='utf-8') as f:
+        with open(test_vdf_path, 'rb') as f:
             content_before_escape = f.read()
         
-        success = manager._modify_vdf_launch_options(content_before_escape, test_vdf_path, test_app_id, tricky_command)
+        success, _ = manager._modify_vdf_launch_options(content_before_escape, test_vdf_path, test_app_id, tricky_command)
         
         if success:
             with open(test_vdf_path, 'r', encoding='utf-8') as f:
@@ -234,6 +233,137 @@ def test_launch_options_catalog():
     print("✅ Launch options catalog tests passed!")
     return True
 
+def _app_block(content, app_id):
+    """Return the text between the braces of app_id's block, or None if it is missing"""
+    data = content.encode('utf-8')
+    _, brace_start, brace_end = _find_vdf_app_block(data, app_id)
+    if brace_start == -1:
+        return None
+    return data[brace_start + 1:brace_end].decode('utf-8')
+
+def test_vdf_app_block_lookup():
+    """Test that the app section is found by VDF structure, not by substring search"""
+    print("\n=== Testing VDF App Section Lookup ===")
+    
+    # Braces inside quoted names and values must not be counted
+    content = create_test_vdf_content().replace('"Test Game"', '"Test {Game} }{"')
+    block = _app_block(content, "12345")
+    assert block is not None and '"Test {Game} }{"' in block and '"tool"' in block, block
+    assert '"Another Game"' not in block, "App section ran into the next app"
+    print("✅ Braces inside quoted strings are ignored")
+    
+    # The App ID as a value, and as a key in an apps block outside Software/Valve/Steam
+    decoys = '''
+"UserLocalConfigStore"
+{
+    "friends"
+    {
+        "last_played"    "12345"
+        "apps"
+        {
+            "12345"
+            {
+                "name"    "Decoy"
+            }
+        }
+    }'''
+    content = create_test_vdf_content().replace('\n"UserLocalConfigStore"\n{', decoys, 1)
+    assert '"Decoy"' in content
+    block = _app_block(content, "12345")
+    assert block is not None and '"Test Game"' in block and '"Decoy"' not in block, block
+    print("✅ Only the apps block under Software/Valve/Steam is used")
+    
+    # Missing App ID: reported as not found, and the config is left alone
+    assert _app_block(create_test_vdf_content(), "99999") is None
+    with TemporaryDirectory() as temp_dir:
+        test_vdf_path = Path(temp_dir) / "localconfig.vdf"
+        test_vdf_path.write_text(create_test_vdf_content(), encoding='utf-8')
+        original = test_vdf_path.read_bytes()
+        
+        manager = OptiScalerManager()
+        assert manager._modify_vdf_launch_options(original, test_vdf_path, "99999", "%command%") == (False, False)
+        assert test_vdf_path.read_bytes() == original, "Config changed for a missing app"
+        assert [p.name for p in Path(temp_dir).iterdir()] == ["localconfig.vdf"], "Stray backup or temp file"
+    print("✅ Missing App ID reported without touching the config")
+    
+    print("✅ VDF app section lookup tests passed!")
+    return True
+
+def _write_tab_separated_vdf(path):
+    """Write the test VDF with Steam's tab-separated LaunchOptions line"""
+    content = create_test_vdf_content().replace('"LaunchOptions"    ', '"LaunchOptions"\t\t')
+    path.write_text(content, encoding='utf-8')
+    return path.read_bytes()
+
+def _backups(directory):
+    """Timestamped config backups in directory"""
+    return [p for p in directory.iterdir() if ".backup_" in p.name]
+
+def test_vdf_in_place_edit():
+    """Test that a same-length edit patches the config in place and keeps a separate backup"""
+    print("\n=== Testing In-Place VDF Edit ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        test_vdf_path = temp_path / "localconfig.vdf"
+        original = _write_tab_separated_vdf(test_vdf_path)
+        inode = test_vdf_path.stat().st_ino
+        
+        # Same length as "existing_option", so the app section keeps its size
+        manager = OptiScalerManager()
+        assert manager._modify_vdf_launch_options(original, test_vdf_path, "54321", "EXISTING_OPTION") == (True, True)
+        
+        updated = test_vdf_path.read_bytes()
+        assert updated == original.replace(b'"existing_option"', b'"EXISTING_OPTION"'), "Unexpected edit"
+        assert test_vdf_path.stat().st_ino == inode, "Same-size edit replaced the file"
+        print("✅ Same-size edit written in place")
+        
+        backups = _backups(temp_path)
+        assert len(backups) == 1, backups
+        assert backups[0].read_bytes() == original, "Backup changed along with the config"
+        assert backups[0].stat().st_ino != inode, "Backup shares the edited inode"
+        assert not (temp_path / "localconfig.vdf.tmp").exists()
+        print("✅ Backup keeps the original content")
+    
+    return True
+
+def test_vdf_rewrite_backup():
+    """Test that a size-changing edit replaces the config and hard-links the old one as backup"""
+    print("\n=== Testing VDF Rewrite Backup ===")
+    
+    with TemporaryDirectory() as temp_dir:
+        temp_path = Path(temp_dir)
+        test_vdf_path = temp_path / "localconfig.vdf"
+        original = _write_tab_separated_vdf(test_vdf_path)
+        inode = test_vdf_path.stat().st_ino
+        
+        new_command = 'WINEDLLOVERRIDES="dxgi=n,b" PROTON_FSR4_UPGRADE=1 %command%'
+        manager = OptiScalerManager()
+        assert manager._modify_vdf_launch_options(original, test_vdf_path, "54321", new_command) == (True, True)
+        
+        updated = test_vdf_path.read_bytes()
+        assert new_command.replace('"', '\\"').encode('utf-8') in updated, "New options missing"
+        assert b'existing_option' not in updated, "Old options still present"
+        assert test_vdf_path.stat().st_ino != inode, "Rewrite did not replace the file"
+        assert not (temp_path / "localconfig.vdf.tmp").exists()
+        print("✅ Size-changing edit replaced the config")
+        
+        backups = _backups(temp_path)
+        assert len(backups) == 1, backups
+        assert backups[0].stat().st_ino == inode, "Backup is not the original file"
+        assert backups[0].read_bytes() == original, "Backup content differs from the original"
+        print("✅ Original config kept as the backup")
+        
+        # Applying the same options again is a no-op, not a second write
+        inode = test_vdf_path.stat().st_ino
+        assert manager._modify_vdf_launch_options(updated, test_vdf_path, "54321", new_command) == (True, False)
+        assert test_vdf_path.read_bytes() == updated, "Config changed for identical options"
+        assert test_vdf_path.stat().st_ino == inode, "Config replaced for identical options"
+        assert len(_backups(temp_path)) == 1, "Backup made for identical options"
+        print("✅ Identical options reported as unchanged")
+    
+    return True
+
 def main():
     """Main test function"""
     print("OptiScaler Manager VDF Launch Options Test Suite")
@@ -245,6 +375,21 @@ def main():
             print("❌ VDF modification tests failed!")
             return 1
         
+        # Test app section lookup
+        if not test_vdf_app_block_lookup():
+            print("❌ VDF app section lookup tests failed!")
+            return 1
+        
+        # Test in-place edits
+        if not test_vdf_in_place_edit():
+            print("❌ In-place VDF edit tests failed!")
+            return 1
+        
+        # Test backups of rewritten configs
+        if not test_vdf_rewrite_backup():
+            print("❌ VDF rewrite backup tests failed!")
+            return 1
+        
         # Test launch options catalog
         if not test_launch_options_catalog():
             print("❌ Launch options catalog tests failed!")